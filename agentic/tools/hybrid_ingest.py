@@ -5,7 +5,6 @@ import asyncio
 import json
 import os
 import re
-import hashlib
 from typing import Any, Dict, List, Tuple
 
 # LangChain tool decorator
@@ -19,6 +18,8 @@ from agentic.tools.url_pick import pick_verified_urls
 
 # 2) Scrape ONLY those URLs
 from scraping.scrapers.scrape_and_download import scrape_and_download
+# Same filename strategy as the scraper (single definition, memoized there)
+from scraping.scrapers.scrape_and_download import _safe_name
 
 # 3) Parse HTML → text (HTML only; PDFs are handled later by the extractor)
 from scraping.core.parse_html import extract_text_from_html
@@ -87,7 +88,7 @@ def _maybe_extend_from_question(question: str) -> int:
     path = _taxonomy_path()
     try:
         from scraping.utils.indicator_matcher import load_indicators as _load_inds
-        items = _load_inds(path)
+        items = list(_load_inds(path))  # shared cached list → copy before appending
     except Exception:
         try:
             items = json.load(open(path, "r", encoding="utf-8"))
@@ -149,21 +150,6 @@ def _try_reload_agent_vectorstore() -> bool:
         return False
 
 
-def _safe_name(url: str) -> str:
-    """
-    Use the same filename strategy as the scraper to deterministically
-    map a URL to its saved file base name. This lets us build a manifest
-    even though downloads are concurrent.
-    """
-    u = re.sub(r"[^a-zA-Z0-9._/-]+", "_", url)
-    u = u.strip("/").replace("://", "_").replace("/", "_")
-    # Keep short and unique – use the same 10-char SHA1 suffix
-    h = hashlib.sha1(url.encode("utf-8")).hexdigest()[:10]
-    if len(u) > 80:
-        u = u[:80]
-    return f"{u}_{h}"
-
-
 def _build_and_save_manifest(urls: List[str]) -> Dict[str, str]:
     """
     Build { saved_filename: original_url } for outputs produced by the scraper.
@@ -181,9 +167,24 @@ def _build_and_save_manifest(urls: List[str]) -> Dict[str, str]:
             if os.path.exists(path):
                 manifest[name] = url
 
+    # Merge into the scraper's manifest; keep its richer entries (ETag/Last-Modified/sha1)
+    merged: Dict[str, object] = {}
+    if os.path.exists(MANIFEST_JSON):
+        try:
+            with open(MANIFEST_JSON, "r", encoding="utf-8") as f:
+                obj = json.load(f)
+            if isinstance(obj, dict):
+                merged = obj
+        except Exception:
+            pass
+    for name, url in manifest.items():
+        entry = merged.get(name)
+        if not (isinstance(entry, dict) and entry.get("url") == url):
+            merged[name] = {"url": url}
+
     # Persist manifest for the extractor (it reads scraping/output/download_manifest.json)
     with open(MANIFEST_JSON, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        json.dump(merged, f, ensure_ascii=False, indent=2)
 
     return manifest
 
@@ -5,6 +5,7 @@ import os
 from urllib.parse import urlparse
 from typing import List
 
+import faiss
 import httpx
 from bs4 import BeautifulSoup
 from langchain_core.tools import tool
@@ -13,6 +14,7 @@ from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_community.vectorstores import FAISS
 
 from agentic.config import FAISS_DIR, EMBED_MODEL, EMBED_DEVICE, REQUEST_TIMEOUT
+from vectorization.upsert_embeddings import build_hnsw_index
 
 _embeddings = HuggingFaceEmbeddings(
     model_name=EMBED_MODEL,
@@ -63,6 +65,9 @@ def ingest_url(url: str) -> str:
 
         vs = _ensure_index()
         vs.add_documents(docs)
+        # Same on-disk index type as the upsert path (the bootstrap store is flat)
+        if not isinstance(vs.index, faiss.IndexHNSW):
+            vs.index = build_hnsw_index(vs.index)
         vs.save_local(FAISS_DIR)
 
         return f"Ingested {len(docs)} chunks from {url}."
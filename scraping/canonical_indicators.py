@@ -87,34 +87,50 @@ def assign_category(canonical_name):
             return category
     return "Other"
 
-# === Load indicators
-with open("economic_indicator.json", "r", encoding="utf-8") as f:
-    indicators = json.load(f)
-
-canonical_map = {}
-
-# === Build canonical alias map with categories
-for item in indicators:
-    canonical_raw = item.get("Canonical Name", "").strip()
-    if not canonical_raw:
-        continue
-
-    canonical = title_case_indicator(canonical_raw)
-    category = assign_category(canonical)
-    aliases = item.get("Aliases", [])
-
-    for alias in aliases + [canonical_raw]:
-        key = normalize(alias)
-        if key not in canonical_map:
-            canonical_map[key] = {
-                "canonical": canonical,
-                "category": category
-            }
-
-# === Save result
-os.makedirs("utils", exist_ok=True)
-output_path = "utils/canonical_indicators.json"
-with open(output_path, "w", encoding="utf-8") as f:
-    json.dump(dict(sorted(canonical_map.items())), f, indent=2, ensure_ascii=False)
-
-print(f"✅ Generated {output_path} with {len(canonical_map)} entries and auto-categorized them.")
+# Paths are relative to the project root (where the pipeline is run from)
+INDICATORS_PATH = "economic_indicator.json"
+OUTPUT_PATH = os.path.join("utils", "canonical_indicators.json")
+
+
+def build() -> dict:
+    """
+    Build the alias → {canonical, category} map from INDICATORS_PATH,
+    write it to OUTPUT_PATH and return it.
+    """
+    # === Load indicators
+    with open(INDICATORS_PATH, "r", encoding="utf-8") as f:
+        indicators = json.load(f)
+
+    canonical_map = {}
+
+    # === Build canonical alias map with categories
+    for item in indicators:
+        canonical_raw = item.get("Canonical Name", "").strip()
+        if not canonical_raw:
+            continue
+
+        canonical = title_case_indicator(canonical_raw)
+        category = assign_category(canonical)
+        aliases = item.get("Aliases", [])
+
+        for alias in aliases + [canonical_raw]:
+            key = normalize(alias)
+            if key not in canonical_map:
+                canonical_map[key] = {
+                    "canonical": canonical,
+                    "category": category
+                }
+
+    # === Save result
+    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
+    tmp = f"{OUTPUT_PATH}.{os.getpid()}.tmp"  # readers never see a half-written map
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(canonical_map.items())), f, indent=2, ensure_ascii=False)
+    os.replace(tmp, OUTPUT_PATH)
+
+    return canonical_map
+
+
+if __name__ == "__main__":
+    result = build()
+    print(f"✅ Generated {OUTPUT_PATH} with {len(result)} entries and auto-categorized them.")
@@ -0,0 +1,72 @@
+# scraping/core/_json.py
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
+
+# orjson is OPTIONAL (C parser/serializer); fall back to stdlib json if missing
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# ijson is OPTIONAL (incremental parser); fall back to a full load if missing
+try:
+    import ijson
+except Exception:
+    ijson = None
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: Optional[int] = 2) -> bytes:
+    """
+    Serialize to UTF-8 bytes (non-ASCII kept as-is, like ensure_ascii=False).
+    orjson only supports 2-space indentation, so any truthy `indent` means 2.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def iter_array(path: str) -> Iterator[Any]:
+    """
+    Yield the items of a top-level JSON array one at a time.
+    Missing or empty files (or a non-array top level) yield nothing. A corrupt
+    file raises (ValueError) instead of looking like a short array, so callers
+    never mistake a truncated read for the full history.
+    """
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return
+    with open(path, "rb") as f:
+        if ijson is not None:
+            try:
+                yield from ijson.items(f, "item", use_float=True)
+            except ijson.JSONError as e:
+                raise ValueError(f"{path}: {e}") from e
+            return
+        data = loads(f.read())
+    if isinstance(data, list):
+        yield from data
+
+
+def dump_array(fp: BinaryIO, items: Iterable[Any]) -> int:
+    """
+    Write `items` as an indented JSON array, one element at a time, so the
+    whole document is never serialized in memory. Returns the item count.
+    """
+    n = 0
+    for item in items:
+        fp.write(b",\n  " if n else b"[\n  ")
+        fp.write(dumps(item).replace(b"\n", b"\n  "))
+        n += 1
+    fp.write(b"\n]" if n else b"[]")
+    return n
@@ -8,8 +8,8 @@ import pdfplumber
 from pdf2image import convert_from_path
 import pytesseract
 
-from .extract_text import extract_sentences  # uses taxonomy auto-update internally
-from ..utils.indicator_matcher import match_indicators
+from .extract_text import extract_sentences, score_records  # uses taxonomy auto-update internally
+from ..utils.indicator_matcher import match_indicators_batch
 
 
 def is_scanned_pdf(doc):
@@ -19,6 +19,7 @@ def is_scanned_pdf(doc):
 def extract_tables_with_pdfplumber(pdf_path, indicators):
     text_blocks = []
     try:
+        row_texts = []
         with pdfplumber.open(pdf_path) as pdf:
             for page_num, page in enumerate(pdf.pages):
                 tables = page.extract_tables()
@@ -27,9 +28,11 @@ def extract_tables_with_pdfplumber(pdf_path, indicators):
                     for row in table:
                         if not row:
                             continue
-                        row_text = " | ".join(cell.strip() if cell else "" for cell in row)
-                        if match_indicators(row_text, indicators):
-                            text_blocks.append(row_text)
+                        row_texts.append(" | ".join(cell.strip() if cell else "" for cell in row))
+            # Match every row in one batch (single spaCy pass for rows without a taxonomy hit)
+            for row_text, hits in zip(row_texts, match_indicators_batch(row_texts, indicators)):
+                if hits:
+                    text_blocks.append(row_text)
             if text_blocks:
                 for preview in text_blocks[:3]:
                     print("🧾 Table Row Preview:", preview)
@@ -102,4 +105,4 @@ def extract_from_pdfs(indicators, folder):
         except Exception as e:
             print(f"❌ PDF extract failed {filename}: {e}")
 
-    return results
+    return score_records(results)
@@ -5,8 +5,7 @@ import os
 import time
 import re
 import json
-import runpy
-from typing import List, Tuple
+from typing import Callable, List, Optional, Tuple
 
 try:
     import spacy
@@ -16,12 +15,14 @@ except Exception:
     _NLP = None
 
 from ..utils.indicator_matcher import (
-    match_indicators, extract_year, nlp_match_indicators
+    extract_year,
+    match_indicators_batch, nlp_match_indicators_batch,
 )
 from .utils import (
-    canonicalize, score_confidence, format_display,
+    canonicalize, score_confidence_batch, format_display,
     extract_domain_from_filename, is_economic_context
 )
+from .taxonomy_utils import rebuild_canonical_map_if_possible
 
 # Single, authoritative taxonomy file
 TAXONOMY_PATH = os.path.abspath("economic_indicator.json")
@@ -54,6 +55,16 @@ def _normalize_matches(matches, sentence_or_line: str) -> List[dict]:
     return norm
 
 
+def _batch_matches(texts: List[str], indicators: list) -> List[List[dict]]:
+    """Taxonomy + heuristic matches per text, parsing all texts in one spaCy pass."""
+    nlp_all = nlp_match_indicators_batch(texts)
+    taxo_all = match_indicators_batch(texts, indicators, nlp_matches=nlp_all)
+    return [
+        _normalize_matches(taxo, t) + _normalize_matches(nlp, t)
+        for t, taxo, nlp in zip(texts, taxo_all, nlp_all)
+    ]
+
+
 def _safe_canonicalize(indicator_name: str) -> dict:
     """Return {'canonical', 'category'} safely for any phrase."""
     try:
@@ -145,6 +156,33 @@ def extract_all_values(text: str) -> List[Tuple[float, str | None]]:
     return results
 
 
+def _parse_year_values(years: list, values: list) -> List[Tuple[int, float]]:
+    """Parse aligned year/value cells once (shared by every alias matched on the row)."""
+    pairs: List[Tuple[int, float]] = []
+    for y, v in zip(years, values):
+        try:
+            pairs.append((int(y), float(v)))
+        except Exception:
+            continue
+    return pairs
+
+
+def score_records(records: List[dict]) -> List[dict]:
+    """
+    Fill "Confidence" for a whole run's records in one score_confidence_batch
+    call (large enough for the compiled kernel). Returns the same list.
+    """
+    confidences = score_confidence_batch(
+        [True] * len(records),
+        [r["Year"] for r in records],
+        [r["Value"] for r in records],
+        [r["Unit"] for r in records],
+    )
+    for r, c in zip(records, confidences):
+        r["Confidence"] = c
+    return records
+
+
 # ───────────────────────────────────────────────────────────────────────────────
 # Auto-update taxonomy with new aliases/canonicals
 # ───────────────────────────────────────────────────────────────────────────────
@@ -163,7 +201,7 @@ def _load_taxonomy_list() -> list:
 
 
 def _atomic_write_json(path: str, obj: object) -> None:
-    tmp = path + ".tmp"
+    tmp = f"{path}.{os.getpid()}.tmp"
     json.dump(obj, open(tmp, "w", encoding="utf-8"), ensure_ascii=False, indent=2)
     os.replace(tmp, path)
 
@@ -183,11 +221,40 @@ def _rebuild_alias_map_if_possible() -> bool:
     """Optional: refresh any derived alias maps your project keeps."""
     if not os.path.exists(CANON_SCRIPT):
         return False
-    try:
-        runpy.run_path(CANON_SCRIPT, run_name="__main__")
+    return rebuild_canonical_map_if_possible()
+
+
+# When not None, alias updates are queued here instead of written (pool workers)
+_PENDING_ALIASES: Optional[List[Tuple[str, str]]] = None
+
+
+def _apply_alias(items: list, canonical_name: str, alias: str) -> bool:
+    """Add canonical/alias to the in-memory taxonomy list. Returns True if it changed."""
+    # find canonical
+    idx = None
+    for i, it in enumerate(items):
+        if isinstance(it, dict) and (it.get("Canonical Name") or "").lower() == canonical_name.lower():
+            idx = i
+            break
+
+    if idx is None:
+        # new canonical
+        items.append({
+            "Canonical Name": canonical_name,
+            "Aliases": [] if alias.lower() == canonical_name.lower() else [alias],
+            "Category": None,
+            "Unit": None
+        })
         return True
-    except Exception:
-        return False
+
+    entry = items[idx]
+    aliases = entry.get("Aliases") or []
+    if alias.lower() not in {a.lower() for a in aliases} and alias.lower() != canonical_name.lower():
+        aliases.append(alias)
+        entry["Aliases"] = aliases
+        items[idx] = entry
+        return True
+    return False
 
 
 def update_taxonomy_alias(canonical_name: str, alias: str) -> bool:
@@ -195,46 +262,52 @@ def update_taxonomy_alias(canonical_name: str, alias: str) -> bool:
     Ensure `economic_indicator.json` contains the canonical entry and alias.
     If the canonical is new → create a new entry.
     If alias is new → append.
-    Returns True if taxonomy changed.
+    Returns True if taxonomy changed (always False while updates are deferred).
     """
-    changed = False
     try:
         if not _looks_like_alias(alias):
             return False
+        if _PENDING_ALIASES is not None:
+            _PENDING_ALIASES.append((canonical_name, alias))
+            return False
 
         items = _load_taxonomy_list()
+        changed = _apply_alias(items, canonical_name, alias)
+        if changed:
+            _atomic_write_json(TAXONOMY_PATH, items)
+        return changed
+    except Exception:
+        # Never block extraction due to taxonomy updates
+        return False
 
-        # find canonical
-        idx = None
-        for i, it in enumerate(items):
-            if isinstance(it, dict) and (it.get("Canonical Name") or "").lower() == canonical_name.lower():
-                idx = i
-                break
 
-        if idx is None:
-            # new canonical
-            items.append({
-                "Canonical Name": canonical_name,
-                "Aliases": [] if alias.lower() == canonical_name.lower() else [alias],
-                "Category": None,
-                "Unit": None
-            })
-            changed = True
-        else:
-            entry = items[idx]
-            aliases = entry.get("Aliases") or []
-            if alias.lower() not in {a.lower() for a in aliases} and alias.lower() != canonical_name.lower():
-                aliases.append(alias)
-                entry["Aliases"] = aliases
-                items[idx] = entry
-                changed = True
+def run_deferring_taxonomy(fn: Callable, *args) -> Tuple[object, List[Tuple[str, str]]]:
+    """
+    Run fn(*args) with taxonomy writes queued instead of applied; returns
+    (result, pending alias updates). Parallel workers use this so only the
+    parent process does the read-modify-write of the taxonomy file.
+    """
+    global _PENDING_ALIASES
+    _PENDING_ALIASES = []
+    try:
+        return fn(*args), _PENDING_ALIASES
+    finally:
+        _PENDING_ALIASES = None
+
 
+def apply_taxonomy_updates(pending: List[Tuple[str, str]]) -> int:
+    """Apply queued (canonical, alias) pairs in one write + one alias-map rebuild."""
+    if not pending:
+        return 0
+    try:
+        items = _load_taxonomy_list()
+        changed = sum(1 for canon, alias in pending if _apply_alias(items, canon, alias))
         if changed:
             _atomic_write_json(TAXONOMY_PATH, items)
+            _rebuild_alias_map_if_possible()
         return changed
     except Exception:
-        # Never block extraction due to taxonomy updates
-        return False
+        return 0
 
 
 # ───────────────────────────────────────────────────────────────────────────────
@@ -250,9 +323,10 @@ def extract_tabular_lines(full_text: str, indicators: list, filename: str) -> Li
     results: List[dict] = []
     changed_any = False
 
+    all_matches = _batch_matches(lines, indicators)
+
     for i, line in enumerate(lines):
-        matches = _normalize_matches(match_indicators(line, indicators), line) \
-                + _normalize_matches(nlp_match_indicators(line), line)
+        matches = all_matches[i]
         if not matches:
             continue
 
@@ -276,25 +350,22 @@ def extract_tabular_lines(full_text: str, indicators: list, filename: str) -> Li
             limit = min(len(years), len(values))
             years, values = years[:limit], values[:limit]
 
+        pairs = _parse_year_values(years, values)
+
         for match in matches:
             raw_alias = match["Indicator"]
             canon = _safe_canonicalize(raw_alias)
             if update_taxonomy_alias(canon["canonical"], raw_alias):
                 changed_any = True
 
-            for idx in range(len(years)):
-                try:
-                    year = int(years[idx]); val = float(values[idx])
-                except Exception:
-                    continue
-                confidence = score_confidence(True, year, val, None)
+            for year, val in pairs:
                 results.append({
                     "Indicator": canon["canonical"],
                     "Indicator Name": canon["canonical"],
                     "Year": year,
                     "Value": val,
                     "Unit": None,
-                    "Confidence": confidence,
+                    "Confidence": None,  # scored per run by score_records
                     "RawText": f"{line} | {year_row} | {value_row}",
                     "DisplayValue": format_display(val, None),
                     "Source": extract_domain_from_filename(filename),
@@ -322,10 +393,11 @@ def process_table_block(table_lines: List[str], indicators: list, filename: str)
     header_line = table_lines[0]
     header_years = re.findall(r"\b(19\d{2}|20\d{2})\b", header_line)
 
+    all_matches = _batch_matches(table_lines[1:], indicators)
+
     for i in range(1, len(table_lines)):
         line = table_lines[i]
-        matches = _normalize_matches(match_indicators(line, indicators), line) \
-                + _normalize_matches(nlp_match_indicators(line), line)
+        matches = all_matches[i - 1]
         if not matches:
             continue
 
@@ -339,25 +411,22 @@ def process_table_block(table_lines: List[str], indicators: list, filename: str)
         else:
             years = header_years
 
+        pairs = _parse_year_values(years, values)
+
         for match in matches:
             raw_alias = match["Indicator"]
             canon = _safe_canonicalize(raw_alias)
             if update_taxonomy_alias(canon["canonical"], raw_alias):
                 changed_any = True
 
-            for idx in range(len(years)):
-                try:
-                    year = int(years[idx]); val = float(values[idx])
-                except Exception:
-                    continue
-                confidence = score_confidence(True, year, val, None)
+            for year, val in pairs:
                 results.append({
                     "Indicator": canon["canonical"],
                     "Indicator Name": canon["canonical"],
                     "Year": year,
                     "Value": val,
                     "Unit": None,
-                    "Confidence": confidence,
+                    "Confidence": None,  # scored per run by score_records
                     "RawText": f"{match['RawText']} | {line}",
                     "DisplayValue": format_display(val, None),
                     "Source": extract_domain_from_filename(filename),
@@ -381,13 +450,10 @@ def extract_sentences(full_text: str, indicators: list, filename: str) -> List[d
     changed_any = False
     doc = _nlp_doc(full_text)
 
-    for sent in doc.sents:
-        sentence = sent.text.strip()
-        if not sentence or not is_economic_context(sentence):
-            continue
+    sentences = [s for s in (sent.text.strip() for sent in doc.sents)
+                 if s and is_economic_context(s)]
 
-        matches = _normalize_matches(match_indicators(sentence, indicators), sentence) \
-                + _normalize_matches(nlp_match_indicators(sentence), sentence)
+    for sentence, matches in zip(sentences, _batch_matches(sentences, indicators)):
         if not matches:
             continue
 
@@ -420,7 +486,6 @@ def extract_sentences(full_text: str, indicators: list, filename: str) -> List[d
             valid_candidates.sort(key=lambda v: token_distance(sentence, raw_alias, v[0]))
             value, unit = valid_candidates[0]
             used_values.add((value, unit))
-            confidence = score_confidence(True, year, value, unit)
 
             results.append({
                 "Indicator": canon["canonical"],
@@ -428,7 +493,7 @@ def extract_sentences(full_text: str, indicators: list, filename: str) -> List[d
                 "Year": year,
                 "Value": value,
                 "Unit": unit,
-                "Confidence": confidence,
+                "Confidence": None,  # scored per run by score_records
                 "RawText": sentence,
                 "DisplayValue": format_display(value, unit),
                 "Source": extract_domain_from_filename(filename),
@@ -463,4 +528,4 @@ def extract_from_text(indicators: list, folder: str) -> List[dict]:
             print(f"⚠️ Skipped {filename}: {e}")
         finally:
             print(f"✅ Done {filename} in {time.time() - start:.2f}s")
-    return results
+    return score_records(results)
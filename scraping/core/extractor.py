@@ -3,13 +3,30 @@ from __future__ import annotations
 
 import os
 import re
-import json
+import sys
 import math
 import pandas as pd
 from collections import Counter
-from typing import Dict, List, Optional, Tuple, Any
-
-from .extract_text import extract_from_text
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
+
+# pyahocorasick is OPTIONAL (multi-pattern alias scan); a plain scan is the fallback
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
+
+# pyarrow is OPTIONAL (C++ CSV writer); pandas is the fallback
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except Exception:
+    pa = None
+
+from . import _json
+from .extract_text import extract_from_text, run_deferring_taxonomy, apply_taxonomy_updates
 from .extract_pdf import extract_from_pdfs
 from .utils import is_valid_entry, remove_duplicates, convert_to_triples
 
@@ -39,8 +56,8 @@ def safe_load_json(path: str) -> Any:
     if not os.path.exists(path):
         return []
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return _json.loads(f.read())
     except Exception:
         return []
 
@@ -60,7 +77,43 @@ def _alias_keys(rec: dict) -> dict:
 
 
 def _alias_list(items: List[dict]) -> List[dict]:
-    return [_alias_keys(dict(it)) for it in items if isinstance(it, dict)]
+    """Alias keys IN PLACE (idempotent); only pass records this module owns."""
+    return [_alias_keys(it) for it in items if isinstance(it, dict)]
+
+
+def _csv_column(values: List[Any]):
+    """
+    One CSV column typed the way DataFrame.to_csv would render it: int columns
+    without gaps stay int64; everything else becomes pandas-formatted text
+    (ints with gaps / int+float → "1.0", bools → "True", NaN/None → empty).
+    """
+    missing = [v is None or (isinstance(v, float) and math.isnan(v)) for v in values]
+    present = [v for v, m in zip(values, missing) if not m]
+    if present and all(isinstance(v, int) and not isinstance(v, bool) for v in present) and not any(missing):
+        return pa.array(values, type=pa.int64())
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        cells = [None if m else repr(float(v)) for v, m in zip(values, missing)]
+    else:
+        cells = [None if m else (v if isinstance(v, str) else str(v)) for v, m in zip(values, missing)]
+    return pa.array(cells, type=pa.string())
+
+
+def _write_csv(records: List[dict], path: str) -> None:
+    """
+    Write records to CSV with pyarrow's C++ writer when possible.
+    Columns are the union of keys in first-seen order and cells are formatted as
+    pandas would, so readers parse the same values. Arrow quotes every header and
+    text cell ("needed" style), where pandas quotes only cells containing , " or newlines.
+    """
+    if pa is not None and records:
+        try:
+            cols = list(dict.fromkeys(k for r in records for k in r))
+            table = pa.table({c: _csv_column([r.get(c) for r in records]) for c in cols})
+            pacsv.write_csv(table, path, pacsv.WriteOptions(quoting_style="needed"))
+            return
+        except Exception:
+            pass
+    pd.DataFrame(records).to_csv(path, index=False)
 
 
 def _normalize_phrase(s: str) -> str:
@@ -71,38 +124,59 @@ def _normalize_phrase(s: str) -> str:
     return t
 
 
+_SPACE_TRANS = str.maketrans({"\u202f": " ", "\xa0": " "})
+
+
 def _to_float_or_none(x) -> Optional[float]:
     if x is None:
         return None
     try:
+        # Fast path: already numeric
+        if isinstance(x, (int, float)):
+            return None if (isinstance(x, float) and math.isnan(x)) else float(x)
         if isinstance(x, str):
-            y = x.replace("\u202f", " ").replace("\xa0", " ")
-            y = y.replace(",", ".")
+            y = x.translate(_SPACE_TRANS).replace(",", ".")
+            # Fast path: plain numeric string (reject nan/inf, the regex path never yields them)
+            try:
+                v = float(y.strip())
+                if math.isfinite(v):
+                    return v
+            except ValueError:
+                pass
             y = re.sub(r"[^\d\.\-\+eE]", "", y)
             if y in ("", "-", "+", ".", "+.", "-."):
                 return None
             return float(y)
-        if isinstance(x, (int, float)) and not (isinstance(x, float) and math.isnan(x)):
-            return float(x)
     except Exception:
         return None
     return None
 
 
+_YEAR_RE = re.compile(r"\b(19[7-9]\d|20[0-4]\d|2025)\b")
+
+
 def _coerce_year(rec: dict) -> Optional[int]:
-    """Infer Year from DateISO or Year field if possible."""
+    """Infer Year from the Year field (int or digit string) or DateISO if possible."""
+    # Already a usable int year → nothing to infer
+    y = rec.get("Year")
+    if isinstance(y, int) and not isinstance(y, bool) and 1970 <= y <= 2049:
+        return y
+    # In-range digit string ("2021" from scraped/ingested rows) → no regex needed
+    if isinstance(y, str) and y.strip().isdigit() and 1970 <= int(y.strip()) <= 2049:
+        return int(y.strip())
     # Prefer DateISO → YYYY-MM-DD or YYYY-MM
     for key in ("DateISO", "date_iso", "date", "Date"):
         val = rec.get(key)
         if isinstance(val, str):
-            m = re.search(r"\b(19[7-9]\d|20[0-4]\d|2025)\b", val)
+            m = _YEAR_RE.search(val)
             if m:
                 try:
                     return int(m.group(1))
                 except Exception:
                     pass
-    # Then plain Year field
-    y = rec.get("Year")
+    # Then plain Year field (never an unusable string such as "FY2021" or "12")
+    if isinstance(y, str):
+        return None
     try:
         return int(y) if y is not None and str(y).isdigit() else None
     except Exception:
@@ -122,8 +196,8 @@ class Taxonomy:
         self.path = path
         os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
         if not os.path.exists(self.path):
-            with open(self.path, "w", encoding="utf-8") as f:
-                json.dump([], f, ensure_ascii=False, indent=2)
+            with open(self.path, "wb") as f:
+                f.write(_json.dumps([]))
 
         raw = safe_load_json(self.path)
         # tolerate legacy {"indicators":[...]} shape
@@ -136,6 +210,7 @@ class Taxonomy:
     def _rebuild_index(self):
         self._canon_norm_to_idx: Dict[str, int] = {}
         self._alias_norm_to_canon: Dict[str, str] = {}
+        self._alias_norm_to_alias: Dict[str, str] = {}  # as written in the taxonomy
 
         for i, it in enumerate(self.items):
             canon = (it.get("Canonical Name") or it.get("name") or "").strip()
@@ -147,10 +222,24 @@ class Taxonomy:
                 a_norm = _normalize_phrase(a)
                 if a_norm:
                     self._alias_norm_to_canon[a_norm] = canon
+                    self._alias_norm_to_alias[a_norm] = a
+        # Built lazily: the index is rebuilt on every alias added during a run
+        self._ac = None
+
+    def _build_automaton(self):
+        if ahocorasick is None:
+            # Longest aliases first so the fallback scan also prefers longest match
+            self._ac = sorted(self._alias_norm_to_canon.items(), key=lambda kv: -len(kv[0]))
+            return
+        ac = ahocorasick.Automaton()
+        for a_norm, canon in self._alias_norm_to_canon.items():
+            ac.add_word(a_norm, (a_norm, canon))
+        ac.make_automaton()
+        self._ac = ac
 
     def save(self):
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(self.items, f, ensure_ascii=False, indent=2)
+        with open(self.path, "wb") as f:
+            f.write(_json.dumps(self.items))
         self._rebuild_index()
 
     def find_canonical_by_alias(self, alias: str) -> Optional[str]:
@@ -158,6 +247,37 @@ class Taxonomy:
             return None
         return self._alias_norm_to_canon.get(_normalize_phrase(alias))
 
+    def find_alias_in_text(self, text: str) -> Optional[Tuple[str, str]]:
+        """
+        Scan free text (e.g. RawText) for any known alias, in one pass over
+        the text. Returns (canonical, alias) for the longest whole-word match.
+        """
+        t = _normalize_phrase(text)
+        if not t:
+            return None
+        if self._ac is None:
+            self._build_automaton()
+
+        def _whole_word(start: int, end: int) -> bool:
+            return (start == 0 or not t[start - 1].isalnum()) and \
+                   (end == len(t) or not t[end].isalnum())
+
+        if ahocorasick is None:
+            for a_norm, canon in self._ac:
+                start = t.find(a_norm)
+                while start != -1:
+                    if _whole_word(start, start + len(a_norm)):
+                        return canon, self._alias_norm_to_alias[a_norm]
+                    start = t.find(a_norm, start + 1)
+            return None
+
+        best: Optional[Tuple[str, str]] = None
+        for end, (a_norm, canon) in self._ac.iter(t):
+            start = end - len(a_norm) + 1
+            if _whole_word(start, end + 1) and (best is None or len(a_norm) > len(best[0])):
+                best = (a_norm, canon)
+        return (best[1], self._alias_norm_to_alias[best[0]]) if best else None
+
     def find_item_by_canonical(self, canonical: str) -> Optional[Dict]:
         idx = self._canon_norm_to_idx.get(_normalize_phrase(canonical))
         return self.items[idx] if idx is not None else None
@@ -196,16 +316,19 @@ class Taxonomy:
 # Mapping & normalization per record
 # ───────────────────────────────────────────────────────────────────────────────
 
-def _attach_source_url(rec: dict, manifest: Dict[str, str]) -> None:
+def _attach_source_url(rec: dict, manifest: Dict[str, Any]) -> None:
     """
     Fill SourceURL using FileRef via manifest, if missing.
-    Manifest is { filename: original_url } written by the downloader.
+    Manifest is { filename: {"url": original_url, ...} } written by the downloader
+    (older manifests map { filename: original_url } directly).
     """
     if rec.get("SourceURL"):
         return
     ref = rec.get("FileRef") or rec.get("file") or rec.get("filename")
     if ref and isinstance(ref, str):
         url = manifest.get(ref)
+        if isinstance(url, dict):
+            url = url.get("url")
         if url:
             rec["SourceURL"] = url
 
@@ -250,6 +373,16 @@ def _infer_canonical_and_alias(rec: dict, tax: Taxonomy) -> Tuple[str, Optional[
             mutated |= tax.add_canonical(phrase, alias=phrase)
             return phrase, phrase, mutated
 
+    # Last resort: a known alias mentioned anywhere in the raw text. The alias
+    # also becomes the record's Indicator (is_valid_entry requires one).
+    raw_text = rec.get("RawText")
+    if isinstance(raw_text, str):
+        hit = tax.find_alias_in_text(raw_text)
+        if hit:
+            canon, alias = hit
+            rec["Indicator"] = alias
+            return canon, alias, mutated
+
     return "", None, mutated
 
 
@@ -287,7 +420,7 @@ def _build_page_content(rec: dict) -> str:
     return " | ".join(parts)
 
 
-def _normalize_record(rec: dict, tax: Taxonomy, manifest: Dict[str, str]) -> Tuple[dict, bool]:
+def _normalize_record(rec: dict, tax: Taxonomy, manifest: Dict[str, Any]) -> Tuple[dict, bool]:
     """
     Ensure record has CanonicalIndicator, attach SourceURL, coerce numeric fields,
     infer Year (if missing), and keep original fields. Returns (record, taxonomy_mutated).
@@ -309,11 +442,15 @@ def _normalize_record(rec: dict, tax: Taxonomy, manifest: Dict[str, str]) -> Tup
     # Normalize unit (leave as-is if present)
     if "Unit" in rec and isinstance(rec["Unit"], str):
         rec["Unit"] = rec["Unit"].strip()
-    # Infer Year if absent
-    if rec.get("Year") is None:
+    # Infer Year if absent. Non-int years ("2021", "FY2021", True) become an int or
+    # None, so is_valid_entry never compares a str against ints.
+    y = rec.get("Year")
+    if y is None:
         y = _coerce_year(rec)
         if y is not None:
             rec["Year"] = y
+    elif isinstance(y, (str, bool)):
+        rec["Year"] = _coerce_year(rec)
 
     # Provide a clean page_content for FAISS
     if "page_content" not in rec or not isinstance(rec["page_content"], str) or not rec["page_content"].strip():
@@ -326,21 +463,25 @@ def _normalize_record(rec: dict, tax: Taxonomy, manifest: Dict[str, str]) -> Tup
 # Merge helper (stable)
 # ───────────────────────────────────────────────────────────────────────────────
 
-def merge_across_runs(existing: List[dict], new_items: List[dict]) -> List[dict]:
-    def make_key(r: dict):
-        return (
-            (r.get("CanonicalIndicator") or r.get("Indicator") or "").strip().lower(),
-            r.get("DateISO") or r.get("Year"),
-            r.get("Value"),
-            (r.get("Unit") or "").strip().lower(),
-            (r.get("SourceURL") or r.get("Source") or "").strip().lower(),
-        )
-
+def merge_across_runs(existing: Iterable[dict], new_items: Iterable[dict]) -> List[dict]:
+    """
+    Merge previously saved records with this run's records (new wins on key clash).
+    Both inputs may be lazy iterators; only the merged map is held in memory.
+    """
+    intern = sys.intern
     merged_map: Dict[Tuple, dict] = {}
-    for item in existing:
-        merged_map[make_key(item)] = item
-    for item in new_items:
-        merged_map[make_key(item)] = item
+    for r in chain(existing, new_items):
+        get = r.get
+        # Interned components: indicator/unit/source strings repeat across
+        # thousands of records, so they share storage and hash fast.
+        key = (
+            intern((get("CanonicalIndicator") or get("Indicator") or "").strip().lower()),
+            get("DateISO") or get("Year"),
+            get("Value"),
+            intern((get("Unit") or "").strip().lower()),
+            intern((get("SourceURL") or get("Source") or "").strip().lower()),
+        )
+        merged_map[key] = r
     return list(merged_map.values())
 
 
@@ -359,9 +500,22 @@ def extract_structured_indicators() -> None:
     manifest = manifest_obj if isinstance(manifest_obj, dict) else {}
 
     print("🔍 Running extraction from text and PDF...")
-    # Extract text-first (HTML → text), then PDFs (data/files)
-    text_results = extract_from_text(tax.items, TEXT_FOLDER)
-    pdf_results = extract_from_pdfs(tax.items, PDF_FOLDER)
+    # Text (HTML → text) and PDFs (data/files) run in parallel: wall-clock ≈ max(text, pdf).
+    # Both would auto-grow the taxonomy file, so the workers only queue their
+    # alias additions and this process applies them once both are done.
+    try:
+        with ProcessPoolExecutor(max_workers=2) as ex:
+            ft = ex.submit(run_deferring_taxonomy, extract_from_text, tax.items, TEXT_FOLDER)
+            fp = ex.submit(run_deferring_taxonomy, extract_from_pdfs, tax.items, PDF_FOLDER)
+            text_results, text_aliases = ft.result()
+            pdf_results, pdf_aliases = fp.result()
+    except BrokenProcessPool as e:
+        print(f"⚠️ Parallel extraction unavailable ({e}); running sequentially")
+        text_results, text_aliases = run_deferring_taxonomy(extract_from_text, tax.items, TEXT_FOLDER)
+        pdf_results, pdf_aliases = run_deferring_taxonomy(extract_from_pdfs, tax.items, PDF_FOLDER)
+    if apply_taxonomy_updates(text_aliases + pdf_aliases):
+        # Reload so tax.save() below keeps the aliases the extractors added
+        tax = Taxonomy(INDICATOR_JSON)
     raw_results = text_results + pdf_results
     print(f"🔎 Total raw extracted this run: {len(raw_results)}")
 
@@ -383,11 +537,23 @@ def extract_structured_indicators() -> None:
     deduped_this_run = remove_duplicates(filtered)
     print(f"🧹 This run after validation+dedupe: {len(deduped_this_run)}")
 
-    # Merge with previous runs
-    existing = _alias_list(safe_load_json(OUTPUT_JSON))
-    print(f"📦 Previously saved records: {len(existing)}")
+    # Merge with previous runs (streamed, one saved record at a time)
+    previously_saved = 0
+
+    def _iter_existing() -> Iterator[dict]:
+        nonlocal previously_saved
+        for it in _json.iter_array(OUTPUT_JSON):
+            if isinstance(it, dict):
+                previously_saved += 1
+                yield _alias_keys(it)
 
-    merged = merge_across_runs(existing, deduped_this_run)
+    try:
+        merged = merge_across_runs(_iter_existing(), deduped_this_run)
+    except (OSError, ValueError) as e:
+        # Never rewrite OUTPUT_JSON from a partial read: that would drop history
+        print(f"❌ Could not read previous results from {OUTPUT_JSON} ({e}); outputs left untouched")
+        raise
+    print(f"📦 Previously saved records: {previously_saved}")
     print(f"🧩 After merging with previous runs (pre-final-dedupe): {len(merged)}")
 
     # Final dedupe + alias normalization
@@ -396,32 +562,42 @@ def extract_structured_indicators() -> None:
     print(f"✅ Final merged & deduped total: {len(merged)}")
 
     # Write outputs
-    with open(OUTPUT_JSON, "w", encoding="utf-8") as f:
-        json.dump(merged, f, indent=2, ensure_ascii=False)
-    pd.DataFrame(merged).to_csv(OUTPUT_CSV, index=False)
+    with open(OUTPUT_JSON, "wb") as f:
+        _json.dump_array(f, merged)
+    _write_csv(merged, OUTPUT_CSV)
+
+    # Summary (single pass over merged for all three counters)
+    ind_c: Counter = Counter()
+    src_c: Counter = Counter()
+    yr_c: Counter = Counter()
+    for r in merged:
+        ind = r.get("CanonicalIndicator") or r.get("Indicator")
+        if ind:
+            ind_c[ind] += 1
+        src = r.get("SourceURL") or r.get("Source")
+        if src:
+            src_c[src] += 1
+        yr = r.get("Year")
+        if yr is not None:
+            yr_c[yr] += 1
 
-    # Summary
     summary = {
         "Taxonomy Mutations (this run)": taxonomy_mutations,
         "Total Extracted (this run)": len(deduped_this_run),
-        "Previously Saved": len(existing),
+        "Previously Saved": previously_saved,
         "Total After Merge": len(merged),
-        "Top Indicators": Counter(
-            [r.get("CanonicalIndicator") or r.get("Indicator") for r in merged if (r.get("CanonicalIndicator") or r.get("Indicator"))]
-        ).most_common(10),
-        "Top Sources": Counter(
-            [r.get("SourceURL") or r.get("Source") for r in merged if (r.get("SourceURL") or r.get("Source"))]
-        ).most_common(10),
-        "Top Years": Counter([r.get("Year") for r in merged if r.get("Year") is not None]).most_common(10),
+        "Top Indicators": ind_c.most_common(10),
+        "Top Sources": src_c.most_common(10),
+        "Top Years": yr_c.most_common(10),
     }
-    with open(SUMMARY_STATS, "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2)
+    with open(SUMMARY_STATS, "wb") as f:
+        f.write(_json.dumps(summary))
     print(f"📊 Summary stats written to {SUMMARY_STATS}")
 
     # Triples for graph/QA enrichment
     triples = convert_to_triples(merged)
-    with open(TRIPLES_JSON, "w", encoding="utf-8") as f:
-        json.dump(triples, f, indent=2, ensure_ascii=False)
+    with open(TRIPLES_JSON, "wb") as f:
+        f.write(_json.dumps(triples))
     print(f"🧠 {len(triples)} graph triples saved to {TRIPLES_JSON}")
 
 
@@ -1,29 +1,34 @@
 # scraping/core/taxonomy_utils.py
 from __future__ import annotations
 
-import json, os, runpy, threading
+import importlib, os, threading
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
 try:
-    from rapidfuzz import fuzz
+    from rapidfuzz import fuzz, process
 except Exception:
     fuzz = None
+    process = None
+
+from . import _json
 
 # Single source of truth for indicators (singular file)
 TAXONOMY_PATH = Path("economic_indicator.json")
 # Your existing builder that emits utils/canonical_indicators.json
 CANON_SCRIPT  = Path("scraping") / "canonical_indicators.py"
+CANON_MODULE  = "scraping.canonical_indicators"
 ALIAS_MAP_PATH = Path("utils") / "canonical_indicators.json"
 
 _LOCK = threading.Lock()
+_CANON_MOD = None  # builder module, imported once per process
 
 
 def _atomic_write(path: Path, obj) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = Path(str(path) + ".tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+    with tmp.open("wb") as f:
+        f.write(_json.dumps(obj))
     os.replace(str(tmp), str(path))
 
 
@@ -31,7 +36,7 @@ def _load_list_or_empty(path: Path) -> List[dict]:
     if not path.exists():
         return []
     try:
-        data = json.load(path.open("r", encoding="utf-8"))
+        data = _json.loads(path.read_bytes())
         return data if isinstance(data, list) else []
     except Exception:
         return []
@@ -44,7 +49,7 @@ def _save_singular(items: List[dict]) -> None:
 def _load_alias_map() -> Dict[str, Dict]:
     if ALIAS_MAP_PATH.exists():
         try:
-            return json.load(ALIAS_MAP_PATH.open("r", encoding="utf-8"))
+            return _json.loads(ALIAS_MAP_PATH.read_bytes())
         except Exception:
             return {}
     return {}
@@ -52,10 +57,13 @@ def _load_alias_map() -> Dict[str, Dict]:
 
 def rebuild_canonical_map_if_possible() -> bool:
     """Re-run your builder to refresh utils/canonical_indicators.json."""
+    global _CANON_MOD
     if not CANON_SCRIPT.exists():
         return False
     try:
-        runpy.run_path(str(CANON_SCRIPT), run_name="__main__")
+        if _CANON_MOD is None:
+            _CANON_MOD = importlib.import_module(CANON_MODULE)
+        _CANON_MOD.build()
         return True
     except Exception:
         return False
@@ -87,27 +95,27 @@ def ensure_indicator_and_alias(alias: str, context: str = "") -> Tuple[str, bool
     # 2) Fuzzy to existing canonical names
     with _LOCK:
         singular = _load_list_or_empty(TAXONOMY_PATH)
-        best_name, best_score = None, -1
-        if fuzz and singular:
-            for item in singular:
-                cname = (item.get("Canonical Name") or "").strip()
-                if not cname:
-                    continue
-                score = fuzz.ratio(_norm(cname), key)
-                if score > best_score:
-                    best_name, best_score = cname, score
-
-        if best_name and best_score >= 88:
-            # append alias to nearest canonical
+        best = None
+        if process and singular:
+            names = []
             for it in singular:
-                if (it.get("Canonical Name") or "").strip().lower() == best_name.lower():
-                    aliases = set((it.get("Aliases") or []))
-                    if raw not in aliases:
-                        it["Aliases"] = list(aliases | {raw})
-                        _save_singular(singular)
-                        rebuild_canonical_map_if_possible()
-                        return best_name, True
-                    return best_name, False
+                cname = (it.get("Canonical Name") or "").strip()
+                if cname:
+                    names.append((_norm(cname), it))
+            # Batch-scores all canonicals in C; best = (choice, score, index)
+            best = process.extractOne(key, [n for n, _ in names], scorer=fuzz.ratio, score_cutoff=88)
+
+        if best:
+            # append alias to nearest canonical
+            it = names[best[2]][1]
+            best_name = (it.get("Canonical Name") or "").strip()
+            aliases = set((it.get("Aliases") or []))
+            if raw not in aliases:
+                it["Aliases"] = list(aliases | {raw})
+                _save_singular(singular)
+                rebuild_canonical_map_if_possible()
+                return best_name, True
+            return best_name, False
 
         # 3) Create a new canonical (Title Case)
         new_canonical = raw.title()
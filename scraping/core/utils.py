@@ -1,16 +1,33 @@
 # scraping/core/utils.py
+import re
 import unicodedata
 from difflib import SequenceMatcher
-from rapidfuzz import process
+from functools import lru_cache
+from rapidfuzz import fuzz, process
 import json
 from pathlib import Path
 
+# numpy/numba are OPTIONAL (batch scoring falls back to the scalar scorer)
+try:
+    import numpy as np
+    from numba import njit, prange
+except Exception:
+    np = None
+    njit = None
+
 # Resolve canonical_indicators.json relative to this file:
 # .../scraping/core/utils.py  ->  parents[1] == .../scraping
 CANONICAL_PATH = Path(__file__).resolve().parents[1] / "utils" / "canonical_indicators.json"
 with CANONICAL_PATH.open("r", encoding="utf-8") as f:
     CANONICAL_MAP = json.load(f)
 
+# Block-page / anti-bot markers that invalidate an extracted record.
+# If this list grows past ~10 patterns, consider pyahocorasick instead.
+_BAD_RE = re.compile(r"access denied|cookies required|captcha|forbidden", re.I)
+
+# Keys are already normalized by the builder; keep one stable list for rapidfuzz
+_CANON_KEYS = list(CANONICAL_MAP.keys())
+
 def normalize(text):
     return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("utf-8").lower()
 
@@ -23,7 +40,10 @@ def format_display(value, unit):
         return f"{value / 1e6:.2f} M {unit}"
     return f"{value:,.0f} {unit}" if unit else f"{value:,.0f}"
 
+@lru_cache(maxsize=100_000)
 def canonicalize(raw):
+    # Cached: extraction loops see the same raw phrases over and over.
+    # Callers must treat the returned dict as read-only.
     key = normalize(raw)
     if key in CANONICAL_MAP:
         entry = CANONICAL_MAP[key]
@@ -31,7 +51,7 @@ def canonicalize(raw):
         category = entry.get("category")
         return {"canonical": canonical, "category": category}
 
-    match = process.extractOne(key, CANONICAL_MAP.keys(), score_cutoff=85)
+    match = process.extractOne(key, _CANON_KEYS, scorer=fuzz.ratio, score_cutoff=85)
     if match:
         entry = CANONICAL_MAP[match[0]]
         canonical = entry.get("canonical", raw).strip()
@@ -53,7 +73,7 @@ def is_valid_entry(ind):
         return False
     if not ind["Indicator"]:
         return False
-    if any(x in ind["RawText"].lower() for x in ["access denied", "cookies required"]):
+    if _BAD_RE.search(ind["RawText"]):
         return False
     if ind["Value"] == ind["Year"]:
         return False
@@ -96,6 +116,54 @@ def score_confidence(matched, year, value, unit):
         score += 20 if unit in ["%", "USD", "TND", "EUR"] else 10
     return max(min(score, 100), 0)
 
+# Unit codes for the batch kernel: -1 = None, 0 = empty, 5 = any other unit
+_UNIT_CODE = {"%": 1, "USD": 2, "TND": 3, "EUR": 4}
+# Below this size JIT dispatch + array building costs more than the scalar loop
+_BATCH_MIN = 256
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _score_kernel(matched, year, value, unit_code):
+        """Vectorized score_confidence; year 0 and value NaN mean missing."""
+        n = len(year)
+        out = np.empty(n, np.int8)
+        for i in prange(n):
+            y = year[i]
+            v = value[i]
+            u = unit_code[i]
+            has_value = v == v
+            score = 0
+            if matched[i]:
+                score += 30
+            if y != 0 and 1970 <= y <= 2050:
+                score += 25
+            if has_value and y != 0 and v == y:
+                score += -50 if u == -1 else -10
+            if has_value and v != 0.0:
+                score += 30
+                if 0 < v < 1 and (u < 1 or u > 4):
+                    score -= 10
+                elif v < 10 and u <= 0:
+                    score -= 15
+            if u > 0:
+                score += 20 if u <= 4 else 10
+            out[i] = max(min(score, 100), 0)
+        return out
+
+
+def score_confidence_batch(matched, years, values, units):
+    """score_confidence over parallel sequences; returns a list of ints."""
+    if njit is None or len(years) < _BATCH_MIN:
+        return [score_confidence(m, y, v, u) for m, y, v, u in zip(matched, years, values, units)]
+    m_arr = np.asarray(matched, dtype=np.bool_)
+    y_arr = np.array([y or 0 for y in years], dtype=np.int64)
+    v_arr = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    u_arr = np.array(
+        [-1 if u is None else _UNIT_CODE.get(u, 5 if u else 0) for u in units],
+        dtype=np.int8,
+    )
+    return _score_kernel(m_arr, y_arr, v_arr, u_arr).tolist()
+
 def convert_to_triples(entries):
     triples = []
     for e in entries:
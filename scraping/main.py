@@ -6,6 +6,13 @@ from core.extractor import extract_structured_indicators
 from services.crawler4Ai import run_crawler
 from scrapers.scrape_and_download import scrape_and_download
 
+# uvloop is OPTIONAL (faster event loop); stdlib asyncio loop otherwise
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except Exception:
+    pass
+
 def main():
     print("🚀 STEP 1: Fetching from Serper...")
     fetch_links()
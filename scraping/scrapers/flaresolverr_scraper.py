@@ -2,6 +2,32 @@ import requests
 import os
 import re
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is OPTIONAL (faster serializer); stdlib json otherwise
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+FLARESOLVERR_URL = "http://localhost:8191/v1"
+WRITE_CHUNK = 64 * 1024
+
+# One pooled keep-alive session to the local FlareSolverr, retrying transient 5xx
+# (POST is retried explicitly: request.get is safe to repeat)
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    ),
+))
 
 def sanitize_filename(url):
     filename = url.strip().rstrip("/").split("/")[-1]
@@ -17,7 +43,7 @@ def fetch_with_flaresolverr(url, save_dir="data/html"):
     }
 
     try:
-        resp = requests.post("http://localhost:8191/v1", json=payload)
+        resp = _SESSION.post(FLARESOLVERR_URL, json=payload, timeout=90)
         if resp.status_code != 200:
             print(f"❌ FlareSolverr HTTP Error {resp.status_code} for {url}")
             _log_blocked_url(url)
@@ -42,7 +68,8 @@ def fetch_with_flaresolverr(url, save_dir="data/html"):
         filename = sanitize_filename(url)
         path = os.path.join(save_dir, filename)
         with open(path, "w", encoding="utf-8") as f:
-            f.write(html)
+            for i in range(0, len(html), WRITE_CHUNK):
+                f.write(html[i:i + WRITE_CHUNK])
 
         print(f"✅ FlareSolverr saved {url} → {path}")
 
@@ -52,5 +79,9 @@ def fetch_with_flaresolverr(url, save_dir="data/html"):
 
 def _log_blocked_url(url, log_path="output/blocked_urls.json"):
     os.makedirs(os.path.dirname(log_path), exist_ok=True)
-    with open(log_path, "a", encoding="utf-8") as f:
-        f.write(json.dumps({"url": url}) + "\n")
+    if orjson is not None:
+        line = orjson.dumps({"url": url}) + b"\n"
+    else:
+        line = (json.dumps({"url": url}) + "\n").encode("utf-8")
+    with open(log_path, "ab") as f:
+        f.write(line)
@@ -1,25 +1,55 @@
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 import os
 import json
 import re
-import time
+import asyncio
 from scrapers.flaresolverr_scraper import fetch_with_flaresolverr
 
+# Pages rendered at once (one shared browser context)
+PAGE_CONCURRENCY = 4
+
+BLOCK_MARKERS = ("verifying you are human", "cloudflare", "access denied")
+
 def sanitize_filename(url):
     filename = url.strip().rstrip("/").split("/")[-1]
     if not filename or "." in filename:
         filename = re.sub(r"[^\w]", "_", url.strip().split("/")[-2]) if len(url.strip().split("/")) > 1 else "page"
     return filename + ".html"
 
-def fetch_pages_with_playwright_from_json(json_path, save_dir="data/html"):
+async def _fetch_one(context, sem, url, save_dir):
+    async with sem:
+        page = await context.new_page()
+        try:
+            print(f"🔍 Visiting: {url}")
+            # Wait for the network to settle instead of a fixed sleep
+            await page.goto(url, wait_until="networkidle", timeout=60000)
+            content = await page.content()
+
+            # Fallback to FlareSolverr if blocked (blocking client → worker thread)
+            if any(kw in content.lower() for kw in BLOCK_MARKERS):
+                print(f"⚠️ Blocked: {url}. Retrying with FlareSolverr...")
+                await asyncio.to_thread(fetch_with_flaresolverr, url, save_dir)
+                return
+
+            filename = sanitize_filename(url)
+            path = os.path.join(save_dir, filename)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            print(f"✅ Saved {url} → {path}")
+        except Exception as e:
+            print(f"❌ Failed to fetch {url}: {e}")
+        finally:
+            await page.close()
+
+async def fetch_pages_with_playwright_async(json_path, save_dir="data/html", concurrency=PAGE_CONCURRENCY):
     with open(json_path, "r", encoding="utf-8") as f:
         urls = json.load(f)
 
     os.makedirs(save_dir, exist_ok=True)
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context(
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
                        "(KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36",
             viewport={"width": 1280, "height": 800},
@@ -28,28 +58,11 @@ def fetch_pages_with_playwright_from_json(json_path, save_dir="data/html"):
             locale="en-US"
         )
 
-        for url in urls:
-            page = context.new_page()
-            try:
-                print(f"🔍 Visiting: {url}")
-                page.goto(url, timeout=60000)
-                time.sleep(10)
-                content = page.content()
-
-                # Fallback to FlareSolverr if blocked
-                if any(kw in content.lower() for kw in ["verifying you are human", "cloudflare", "access denied"]):
-                 print(f"⚠️ Blocked: {url}. Retrying with FlareSolverr...")
-                 fetch_with_flaresolverr(url, save_dir)
-                continue
-            
-                filename = sanitize_filename(url)
-                path = os.path.join(save_dir, filename)
-                with open(path, "w", encoding="utf-8") as f:
-                    f.write(content)
-                print(f"✅ Saved {url} → {path}")
-            except Exception as e:
-                print(f"❌ Failed to fetch {url}: {e}")
-            finally:
-                page.close()
-
-        browser.close()
+        sem = asyncio.Semaphore(concurrency)
+        await asyncio.gather(*[_fetch_one(context, sem, url, save_dir) for url in urls])
+
+        await browser.close()
+
+def fetch_pages_with_playwright_from_json(json_path, save_dir="data/html"):
+    """Synchronous entry point (runs the async scraper to completion)."""
+    asyncio.run(fetch_pages_with_playwright_async(json_path, save_dir))
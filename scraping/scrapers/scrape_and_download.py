@@ -4,13 +4,34 @@ from __future__ import annotations
 import os
 import re
 import json
+import codecs
 import asyncio
 import hashlib
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 import httpx
 from urllib.parse import urlparse
 
+# orjson is OPTIONAL (faster manifest load/save); stdlib json otherwise
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# aiofiles is OPTIONAL (non-blocking file writes); falls back to a worker thread
+try:
+    import aiofiles
+except Exception:
+    aiofiles = None
+
+# HTTP/2 is OPTIONAL (needs the h2 package: pip install "httpx[http2]")
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except Exception:
+    HTTP2 = False
+
 # ---- Paths -------------------------------------------------------------------
 HTML_DIR = "data/html"
 FILES_DIR = "data/files"
@@ -43,8 +64,20 @@ except Exception:
     _MAX_MB = 50
 MAX_DOWNLOAD_BYTES = int(_MAX_MB) * 1024 * 1024
 
+# Max downloads in flight at once (also the connection pool size)
+MAX_CONCURRENCY = 16
+# ...and per host, so one slow domain can't take every slot
+PER_HOST_CONCURRENCY = 2
+
+# Transport-level retries for failed connects (DNS hiccups, refused/reset sockets)
+CONNECT_RETRIES = 2
+
+# Streamed bodies are read/written in chunks of this size
+CHUNK_SIZE = 64 * 1024
+
 # Guard rails for false/blocked pages
 MIN_HTML_BYTES = 1500  # drop tiny HTML (likely error/placeholder)
+BLOCK_SCAN_CHARS = 8192  # block-page markers live near the top; don't scan the rest
 BLOCK_HTML_IF_URL_LOOKS_BINARY = True  # e.g., URL ends with .pdf but returns text/html
 
 
@@ -52,10 +85,11 @@ BLOCK_HTML_IF_URL_LOOKS_BINARY = True  # e.g., URL ends with .pdf but returns te
 # Helpers
 # ───────────────────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=4096)
 def _safe_name(url: str) -> str:
     """
     Turn a URL into a deterministic, filesystem-safe name with a short hash.
-    Must stay consistent with agentic/tools/hybrid_ingest.py
+    Also used by agentic/tools/hybrid_ingest.py to map URLs back to saved files.
     """
     base = re.sub(r"[^a-zA-Z0-9._/-]+", "_", url).strip("/")
     base = base.replace("://", "_").replace("/", "_")
@@ -74,6 +108,17 @@ def _exists_recent(path: str, fresh_hours: int) -> bool:
     return (datetime.now() - mtime) < timedelta(hours=fresh_hours)
 
 
+_CD_RFC5987 = re.compile(r'filename\*\s*=\s*[^\'"]+\'\'([^;]+)', re.I)
+_CD_QUOTED = re.compile(r'filename\s*=\s*"([^"]+)"', re.I)
+_CD_BARE = re.compile(r'filename\s*=\s*([^;]+)', re.I)
+
+# Known extensions → saved extension (.htm is normalized to .html)
+_EXT_MAP = {
+    ".pdf": ".pdf", ".xlsx": ".xlsx", ".xls": ".xls", ".csv": ".csv", ".json": ".json",
+    ".html": ".html", ".htm": ".html", ".xhtml": ".xhtml", ".xml": ".xml", ".txt": ".txt",
+}
+
+
 def _parse_content_disposition_filename(cd: str) -> Optional[str]:
     """
     Extract filename from Content-Disposition header if present.
@@ -82,26 +127,22 @@ def _parse_content_disposition_filename(cd: str) -> Optional[str]:
     if not cd:
         return None
     # RFC 5987 (filename*)
-    m = re.search(r'filename\*\s*=\s*[^\'"]+\'\'([^;]+)', cd, flags=re.I)
+    m = _CD_RFC5987.search(cd)
     if m:
         return m.group(1).strip().strip('"')
     # Classic filename=
-    m = re.search(r'filename\s*=\s*"([^"]+)"', cd, flags=re.I)
+    m = _CD_QUOTED.search(cd)
     if m:
         return m.group(1).strip()
-    m = re.search(r'filename\s*=\s*([^;]+)', cd, flags=re.I)
+    m = _CD_BARE.search(cd)
     if m:
         return m.group(1).strip().strip('"')
     return None
 
 
 def _ext_from_filename(name: str) -> Optional[str]:
-    name = name or ""
-    lower = name.lower()
-    for ext in (".pdf", ".xlsx", ".xls", ".csv", ".json", ".html", ".htm", ".xhtml", ".xml", ".txt"):
-        if lower.endswith(ext):
-            return ".html" if ext == ".htm" else ext
-    return None
+    _, dot, tail = (name or "").lower().rpartition(".")
+    return _EXT_MAP.get(dot + tail) if dot else None
 
 
 def _guess_extension(url: str, content_type: str, content_disp: str | None = None) -> str:
@@ -145,21 +186,69 @@ def _guess_extension(url: str, content_type: str, content_disp: str | None = Non
     return ".html"
 
 
-def _load_manifest() -> Dict[str, str]:
-    if not os.path.exists(MANIFEST_JSON):
-        return {}
+# Parsed manifest kept across calls; re-read only when the file changes on disk
+# (hybrid_ingest and the extractor read/write the same file in-process)
+_MANIFEST_CACHE: Optional[Dict[str, dict]] = None
+_MANIFEST_STAT: Optional[Tuple[int, int]] = None
+
+
+def _manifest_stat() -> Optional[Tuple[int, int]]:
     try:
-        with open(MANIFEST_JSON, "r", encoding="utf-8") as f:
-            obj = json.load(f)
-            return obj if isinstance(obj, dict) else {}
-    except Exception:
-        return {}
+        st = os.stat(MANIFEST_JSON)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
 
-def _save_manifest(manifest: Dict[str, str]) -> None:
+def _load_manifest() -> Dict[str, dict]:
+    """
+    { filename: {"url", "etag", "last_modified", "sha1"} }, parsed once and
+    reused until the file changes. Returns a copy, so callers may update it
+    freely; the cache only changes through a successful _save_manifest.
+    """
+    global _MANIFEST_CACHE, _MANIFEST_STAT
+    stat = _manifest_stat()
+    if _MANIFEST_CACHE is None or stat != _MANIFEST_STAT:
+        _MANIFEST_CACHE = _read_manifest() if stat else {}
+        _MANIFEST_STAT = stat
+    return dict(_MANIFEST_CACHE)
+
+
+def _read_manifest() -> Dict[str, dict]:
+    """
+    Parse the manifest file. Old-style { filename: url } entries are
+    migrated on the fly.
+    """
     try:
-        with open(MANIFEST_JSON, "w", encoding="utf-8") as f:
-            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        with open(MANIFEST_JSON, "rb") as f:
+            raw = f.read()
+        obj = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception:
+        return {}
+    if not isinstance(obj, dict):
+        return {}
+    manifest: Dict[str, dict] = {}
+    for name, entry in obj.items():
+        if isinstance(entry, str):
+            manifest[name] = {"url": entry}
+        elif isinstance(entry, dict) and entry.get("url"):
+            manifest[name] = entry
+    return manifest
+
+
+def _save_manifest(manifest: Dict[str, dict]) -> None:
+    global _MANIFEST_CACHE, _MANIFEST_STAT
+    # Temp file + os.replace so readers never see a half-written manifest
+    tmp = f"{MANIFEST_JSON}.{os.getpid()}.tmp"
+    try:
+        if orjson is not None:
+            with open(tmp, "wb") as f:
+                f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, MANIFEST_JSON)
+        _MANIFEST_CACHE, _MANIFEST_STAT = dict(manifest), _manifest_stat()
     except Exception:
         # non-fatal
         pass
@@ -175,6 +264,7 @@ def _target_paths(base_name: str, ext: str) -> Tuple[str, str]:
         return os.path.join(FILES_DIR, f"{base_name}{ext}"), "files"
 
 
+@lru_cache(maxsize=4096)
 def _origin_referer(url: str) -> str:
     """
     Best-effort origin referer (helps some hosts).
@@ -186,22 +276,153 @@ def _origin_referer(url: str) -> str:
         return ""
 
 
-def _looks_like_block_page(text: str) -> bool:
+_BLOCK_SNIPS = (
+    "403", "forbidden", "access denied", "not authorized", "captcha",
+    "you don't have permission", "you do not have permission",
+    "robot check", "attention required",
+)
+# Single compiled union → one pass over the page instead of one per snippet
+_BLOCK_RE = re.compile("|".join(map(re.escape, _BLOCK_SNIPS)), re.I)
+_BINARY_EXTS = (".pdf", ".xlsx", ".xls", ".csv", ".json")
+
+
+def _looks_like_block_page(text: str, limit: int = BLOCK_SCAN_CHARS) -> bool:
     """
     Detect common block pages to avoid polluting corpus with useless HTML.
+    Only the first `limit` characters are scanned.
     """
-    t = (text or "").lower()
-    bad_snips = (
-        "403", "forbidden", "access denied", "not authorized", "captcha",
-        "you don't have permission", "you do not have permission",
-        "robot check", "attention required",
-    )
-    return any(sn in t for sn in bad_snips)
+    return bool(_BLOCK_RE.search((text or "")[:limit]))
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    return urlparse(url).netloc
 
 
 def _url_looks_binary(url: str) -> bool:
-    u = url.lower()
-    return any(u.endswith(ext) for ext in (".pdf", ".xlsx", ".xls", ".csv", ".json"))
+    return url.lower().endswith(_BINARY_EXTS)
+
+
+def _html_for_binary_url(url: str, ext: str) -> bool:
+    """URL names a document (.pdf, .xlsx, ...) but the server answers with HTML."""
+    return BLOCK_HTML_IF_URL_LOOKS_BINARY and ext == ".html" and _url_looks_binary(url)
+
+
+def _conditional_headers(entry: Optional[dict]) -> Dict[str, str]:
+    """
+    If-None-Match / If-Modified-Since from a manifest entry (empty if none).
+    """
+    headers: Dict[str, str] = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _content_range_total(cr: str) -> Optional[int]:
+    """'bytes 0-0/12345' → 12345 (None if absent or '*')."""
+    m = re.search(r"/(\d+)\s*$", cr or "")
+    return int(m.group(1)) if m else None
+
+
+async def _probe(
+    client: httpx.AsyncClient, url: str, headers: Dict[str, str]
+) -> Optional[httpx.Response]:
+    """
+    Fetch headers only: HEAD, or a 1-byte ranged GET when HEAD is refused.
+    Returns None if neither works (the caller then just does the full GET).
+    """
+    try:
+        r = await client.head(url, follow_redirects=True, headers=headers)
+        if r.status_code in (403, 405, 501):
+            ranged = {**headers, "Range": "bytes=0-0"}
+            async with client.stream("GET", url, follow_redirects=True, headers=ranged) as r:
+                pass  # body is never read
+        return r
+    except httpx.HTTPError:
+        return None
+
+
+def _probe_size(r: httpx.Response) -> Optional[int]:
+    if r.status_code == 206:
+        return _content_range_total(r.headers.get("content-range", ""))
+    try:
+        return int(r.headers.get("content-length", "")) or None
+    except ValueError:
+        return None
+
+
+def _keep_cached(path: str, url: str, entry: dict) -> Tuple[str, str, dict]:
+    """Upstream unchanged → keep the file, just refresh its mtime."""
+    os.utime(path, None)
+    print(f"♻️ {url} → not modified, kept {os.path.basename(path)}")
+    return (path, url, entry)
+
+
+class _ThreadFile:
+    """Fallback async binary writer: each blocking call runs in a worker thread."""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._f = None
+
+    async def __aenter__(self) -> "_ThreadFile":
+        self._f = await asyncio.to_thread(open, self._path, "wb")
+        return self
+
+    async def write(self, data: bytes) -> int:
+        return await asyncio.to_thread(self._f.write, data)
+
+    async def __aexit__(self, *exc) -> None:
+        await asyncio.to_thread(self._f.close)
+
+
+def _aopen_wb(path: str):
+    """Open `path` for binary writing without blocking the event loop."""
+    return aiofiles.open(path, "wb") if aiofiles is not None else _ThreadFile(path)
+
+
+class _TooLarge(Exception):
+    """Raised while streaming once a body exceeds MAX_DOWNLOAD_BYTES."""
+
+
+_CHARSET_RE = re.compile(r"charset=[\"']?([^;\"'\s]+)", re.I)
+
+
+def _charset(content_type: str) -> str:
+    """Charset declared in Content-Type; utf-8 if absent or unknown to Python."""
+    m = _CHARSET_RE.search(content_type or "")
+    if m:
+        try:
+            return codecs.lookup(m.group(1)).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+async def _iter_text(r: httpx.Response) -> AsyncIterator[str]:
+    """
+    Decode a streamed body chunk by chunk using the declared charset (no
+    content sniffing). Raises _TooLarge past MAX_DOWNLOAD_BYTES.
+    """
+    enc = _charset(r.headers.get("content-type", ""))
+    decoder = codecs.getincrementaldecoder(enc)(errors="replace")
+    total = 0
+    async for chunk in r.aiter_bytes(chunk_size=CHUNK_SIZE):
+        total += len(chunk)
+        if total > MAX_DOWNLOAD_BYTES:
+            raise _TooLarge()
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
 
 
 # ───────────────────────────────────────────────────────────────────────────────
@@ -214,74 +435,159 @@ async def _download_with_retry(
     fresh_hours: int,
     force: bool,
     retries: int = 1,
-) -> Optional[Tuple[str, str]]:
+    cached: Optional[Tuple[str, dict]] = None,
+) -> Optional[Tuple[str, str, dict]]:
     """
     Fetch URL and save to disk.
-    Returns (saved_path, original_url) or None on failure.
+    Returns (saved_path, original_url, manifest_entry) or None on failure.
+    `cached` is (filename, manifest_entry) from a previous run; when that file
+    is still on disk the GET is made conditional and a 304 reuses it.
     Retries once on transient network errors.
     """
     attempt = 0
     while True:
+        tmp_path = None
         try:
             base = _safe_name(url)
 
-            # GET directly (HEAD often blocked). Follow redirects.
-            r = await client.get(
-                url,
-                follow_redirects=True,
-                headers={**HEADERS, "Referer": _origin_referer(url)},
-            )
-
-            # Accept only real 2xx responses
-            if not (200 <= r.status_code < 300):
-                print(f"❌ {url} → HTTP {r.status_code}, skipping")
-                return None
-
-            ct = (r.headers.get("content-type") or "").lower()
-            cd = r.headers.get("content-disposition")
-            ext = _guess_extension(url, ct, cd)
-            out_path, which = _target_paths(base, ext)
-
-            # Cache / freshness
-            if not force and _exists_recent(out_path, fresh_hours):
-                return (out_path, url)
-
-            # Size guard (if Content-Length present)
-            try:
-                clen = int(r.headers.get("content-length", "0"))
-                if clen and clen > MAX_DOWNLOAD_BYTES:
-                    print(f"❌ {url} → Skipped (too large: {clen} bytes)")
-                    return None
-            except Exception:
-                pass
-
-            # Decide how to save
-            if ext == ".html":
-                text = r.text or ""
-                # Block pages / tiny placeholders
-                if (BLOCK_HTML_IF_URL_LOOKS_BINARY and _url_looks_binary(url)) or \
-                   len(text.encode("utf-8")) < MIN_HTML_BYTES or \
-                   _looks_like_block_page(text):
-                    print(f"❌ {url} → HTML looks blocked/invalid (len={len(text)}), skipping")
+            # Conditional GET only makes sense if the cached copy still exists
+            cached_path = None
+            validators: Dict[str, str] = {}
+            if cached:
+                cname, centry = cached
+                cpath, _ = _target_paths(os.path.splitext(cname)[0], os.path.splitext(cname)[1])
+                if os.path.exists(cpath):
+                    cached_path = cpath
+                    validators = _conditional_headers(centry)
+
+            req_headers = {**HEADERS, "Referer": _origin_referer(url), **validators}
+
+            # Cheap header probe: skip unchanged, fresh or oversized resources
+            # before any body transfer. If the probe fails, the GET decides.
+            probe = await _probe(client, url, req_headers)
+            if probe is not None:
+                if probe.status_code == 304 and cached_path:
+                    return _keep_cached(cached_path, url, cached[1])
+                if 200 <= probe.status_code < 300:
+                    p_ext = _guess_extension(
+                        url,
+                        (probe.headers.get("content-type") or "").lower(),
+                        probe.headers.get("content-disposition"),
+                    )
+                    if _html_for_binary_url(url, p_ext):
+                        print(f"❌ {url} → HTML served for a document URL, skipping")
+                        return None
+                    p_path, _ = _target_paths(base, p_ext)
+                    if not force and _exists_recent(p_path, fresh_hours):
+                        return (p_path, url, cached[1] if cached_path == p_path else {"url": url})
+                    etag = probe.headers.get("etag")
+                    if etag and cached_path == p_path and etag == cached[1].get("etag"):
+                        return _keep_cached(cached_path, url, cached[1])
+                    size = _probe_size(probe)
+                    if size and size > MAX_DOWNLOAD_BYTES:
+                        print(f"❌ {url} → Skipped (too large: {size} bytes)")
+                        return None
+
+            # Full GET. Follow redirects.
+            # The body is streamed so nothing larger than one chunk is buffered
+            # for files, and oversized responses are aborted early.
+            async with client.stream("GET", url, follow_redirects=True, headers=req_headers) as r:
+                if r.status_code == 304 and cached_path:
+                    return _keep_cached(cached_path, url, cached[1])
+
+                # Accept only real 2xx responses
+                if not (200 <= r.status_code < 300):
+                    print(f"❌ {url} → HTTP {r.status_code}, skipping")
                     return None
 
-                with open(out_path, "w", encoding="utf-8", errors="ignore") as f:
-                    f.write(text)
-                print(f"✅ {url} → html saved: {os.path.basename(out_path)}")
-            else:
-                content = r.content or b""
-                if len(content) == 0:
-                    print(f"❌ {url} → Empty body for binary, skipping")
-                    return None
-                if len(content) > MAX_DOWNLOAD_BYTES:
-                    print(f"❌ {url} → Skipped (download exceeded max size)")
+                ct = (r.headers.get("content-type") or "").lower()
+                cd = r.headers.get("content-disposition")
+                ext = _guess_extension(url, ct, cd)
+                # Wrong type is decidable from headers: drop before reading the body
+                if _html_for_binary_url(url, ext):
+                    await r.aclose()
+                    print(f"❌ {url} → HTML served for a document URL, skipping")
                     return None
-                with open(out_path, "wb") as f:
-                    f.write(content)
-                print(f"✅ {url} → file saved: {os.path.basename(out_path)} ({len(content)} bytes)")
-
-            return (out_path, url)
-
+                out_path, which = _target_paths(base, ext)
+
+                # Cache / freshness
+                if not force and _exists_recent(out_path, fresh_hours):
+                    return (out_path, url, cached[1] if cached_path == out_path else {"url": url})
+
+                # Size guard (if Content-Length present)
+                try:
+                    clen = int(r.headers.get("content-length", "0"))
+                    if clen and clen > MAX_DOWNLOAD_BYTES:
+                        print(f"❌ {url} → Skipped (too large: {clen} bytes)")
+                        return None
+                except Exception:
+                    pass
+
+                # Write to a temp path, then os.replace for atomicity
+                tmp_path = out_path + ".part"
+
+                entry = {
+                    "url": url,
+                    "etag": r.headers.get("etag"),
+                    "last_modified": r.headers.get("last-modified"),
+                }
+                digest = hashlib.sha1()
+
+                # Decide how to save
+                if ext == ".html":
+                    # Buffer only the head for the block-page check, then
+                    # stream the rest straight to disk (re-encoded as UTF-8)
+                    pieces = _iter_text(r)
+                    head = ""
+                    async for piece in pieces:
+                        head += piece
+                        if len(head) >= BLOCK_SCAN_CHARS:
+                            break
+                    if _looks_like_block_page(head):
+                        await pieces.aclose()
+                        print(f"❌ {url} → HTML looks blocked/invalid (len={len(head)}), skipping")
+                        return None
+
+                    written = 0
+                    async with _aopen_wb(tmp_path) as f:
+                        piece = head
+                        while True:
+                            data = piece.encode("utf-8", errors="ignore")
+                            digest.update(data)
+                            await f.write(data)
+                            written += len(data)
+                            try:
+                                piece = await pieces.__anext__()
+                            except StopAsyncIteration:
+                                break
+                    # Tiny placeholders
+                    if written < MIN_HTML_BYTES:
+                        print(f"❌ {url} → HTML looks blocked/invalid (len={written}), skipping")
+                        return None
+                    os.replace(tmp_path, out_path)
+                    print(f"✅ {url} → html saved: {os.path.basename(out_path)} [{r.http_version}]")
+                else:
+                    total = 0
+                    async with _aopen_wb(tmp_path) as f:
+                        async for chunk in r.aiter_bytes(chunk_size=CHUNK_SIZE):
+                            total += len(chunk)
+                            if total > MAX_DOWNLOAD_BYTES:
+                                raise _TooLarge()
+                            digest.update(chunk)
+                            await f.write(chunk)
+                    if total == 0:
+                        print(f"❌ {url} → Empty body for binary, skipping")
+                        return None
+                    os.replace(tmp_path, out_path)
+                    print(f"✅ {url} → file saved: {os.path.basename(out_path)} ({total} bytes) [{r.http_version}]")
+
+                entry["sha1"] = digest.hexdigest()
+
+            return (out_path, url, entry)
+
+        except _TooLarge:
+            print(f"❌ {url} → Skipped (download exceeded max size)")
+            return None
         except (httpx.ReadTimeout, httpx.ConnectTimeout, httpx.RemoteProtocolError) as e:
             if attempt < retries:
                 attempt += 1
@@ -294,6 +600,10 @@ async def _download_with_retry(
         except Exception as e:
             print(f"❌ {url} → Unexpected error: {e}")
             return None
+        finally:
+            # Leftover partial file from an aborted/failed stream
+            if tmp_path and os.path.exists(tmp_path):
+                _remove_quietly(tmp_path)
 
 
 # ───────────────────────────────────────────────────────────────────────────────
@@ -309,7 +619,8 @@ async def scrape_and_download(
     Download ONLY the provided URLs (no crawling).
     - Saves HTML to data/html, and files (pdf/xlsx/xls/csv/json) to data/files
     - Returns list of saved absolute paths
-    - Updates scraping/output/download_manifest.json (filename → URL)
+    - Updates scraping/output/download_manifest.json (filename → URL + ETag/Last-Modified/sha1)
+    - Re-fetches conditionally: a 304 Not Modified keeps the file already on disk
     - Skips non-2xx, blocked 403/“Access Denied” HTML wrappers, and tiny placeholder HTML.
     """
     saved: List[str] = []
@@ -328,25 +639,48 @@ async def scrape_and_download(
     if not targets:
         return saved
 
+    # Consecutive requests to the same host reuse its warm keep-alive connection
+    targets.sort(key=_netloc)
+
+    # Previous validators, keyed by URL, for conditional GETs
+    manifest = await asyncio.to_thread(_load_manifest)
+    by_url = {e["url"]: (name, e) for name, e in manifest.items()}
+
     # Local manifest (merge into global at end)
-    local_manifest: Dict[str, str] = {}
-
-    limits = httpx.Limits(max_keepalive_connections=8, max_connections=8)
-    async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, headers=HEADERS, limits=limits) as client:
-        tasks = [_download_with_retry(client, u, fresh_hours, force, retries=1) for u in targets]
-        for coro in asyncio.as_completed(tasks):
-            res = await coro
-            if res:
-                path, orig_url = res
-                abs_path = os.path.abspath(path)
-                saved.append(abs_path)
-                # manifest key = filename only (not full path)
-                local_manifest[os.path.basename(path)] = orig_url
+    local_manifest: Dict[str, dict] = {}
+
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    host_sems: Dict[str, asyncio.Semaphore] = {}
+    limits = httpx.Limits(max_keepalive_connections=MAX_CONCURRENCY, max_connections=MAX_CONCURRENCY)
+    # h2 multiplexes same-host requests over one connection when available;
+    # an explicit transport owns pooling/http2 and retries failed connects
+    transport = httpx.AsyncHTTPTransport(http2=HTTP2, limits=limits, retries=CONNECT_RETRIES)
+    async with httpx.AsyncClient(transport=transport, timeout=DEFAULT_TIMEOUT, headers=HEADERS) as client:
+
+        async def _bound(u: str):
+            host = _netloc(u)
+            host_sem = host_sems.setdefault(host, asyncio.Semaphore(PER_HOST_CONCURRENCY))
+            # Take the host slot first so queued same-host tasks don't hold global slots
+            async with host_sem, sem:
+                return await _download_with_retry(
+                    client, u, fresh_hours, force, retries=1, cached=by_url.get(u)
+                )
+
+        results = await asyncio.gather(*[_bound(u) for u in targets], return_exceptions=True)
+
+    for res in results:
+        if not res or isinstance(res, BaseException):
+            continue
+        path, orig_url, entry = res
+        abs_path = os.path.abspath(path)
+        saved.append(abs_path)
+        # manifest key = filename only (not full path)
+        local_manifest[os.path.basename(path)] = entry
 
     # Merge manifest changes (only for successfully saved files)
     if local_manifest:
-        manifest = _load_manifest()
+        manifest = await asyncio.to_thread(_load_manifest)
         manifest.update(local_manifest)
-        _save_manifest(manifest)
+        await asyncio.to_thread(_save_manifest, manifest)
 
     return saved
@@ -14,22 +14,35 @@ async def run_crawler(seed_file="serper_links.json", output_file="crawled_links.
         seeds = json.load(f)
 
     crawled = []
+    seen = set()
+
+    # Pages are network-bound: crawl them concurrently, a few at a time
+    sem = asyncio.Semaphore(8)
 
     async with AsyncWebCrawler() as crawler:
-        for idx, url in enumerate(seeds[:10], 1):  # Adjust limit if needed
-            try:
-                print(f"🔗 Crawling {idx}: {url}")
-                result = await crawler.arun(url=url)
-                if hasattr(result, "links"):
-                    links = [
-                        link.url if hasattr(link, "url") else link
-                        for link in result.links
-                    ]
-                    crawled.extend(links)
-            except Exception as e:
-                print(f"❌ Error crawling {url}: {e}")
+        async def _one(idx, url):
+            async with sem:
+                try:
+                    print(f"🔗 Crawling {idx}: {url}")
+                    return await crawler.arun(url=url)
+                except Exception as e:
+                    print(f"❌ Error crawling {url}: {e}")
+                    return None
+
+        results = await asyncio.gather(
+            *[_one(idx, url) for idx, url in enumerate(seeds[:10], 1)]  # Adjust limit if needed
+        )
+
+    for result in results:
+        if result is None or not hasattr(result, "links"):
+            continue
+        for link in result.links:
+            link = link.url if hasattr(link, "url") else link
+            if link not in seen:
+                seen.add(link)
+                crawled.append(link)
 
     with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(list(set(crawled)), f, indent=2)
+        json.dump(crawled, f, indent=2)
 
     print(f"✅ Crawling completed. {len(crawled)} links saved to {output_file}")
@@ -1,5 +1,5 @@
 from duckduckgo_search import DDGS
-import pandas as pd
+from openpyxl import Workbook
 
 query = "Tunisia economic indicators 2018..2025 site:ins.tn OR site:worldbank.org OR site:imf.org"
 
@@ -12,5 +12,9 @@ with DDGS(useragent="Mozilla/5.0") as ddgs:  # Add useragent here
             "snippet": r.get("body", "")
         })
 
-df = pd.DataFrame(results)
-df.to_excel("tunisia_economic_links_2018_2025.xlsx", index=False)
+wb = Workbook(write_only=True)
+ws = wb.create_sheet("Sheet1")
+ws.append(["title", "url", "snippet"])
+for r in results:
+    ws.append([r["title"], r["url"], r["snippet"]])
+wb.save("tunisia_economic_links_2018_2025.xlsx")
@@ -4,9 +4,26 @@ import os
 import re
 import time
 import json
+import asyncio
+import httpx
 import requests
-import pandas as pd
+from openpyxl import Workbook
+from functools import lru_cache
 from typing import List, Dict, Iterable
+from urllib.parse import urlparse
+
+# orjson is OPTIONAL (much faster serializer); stdlib json otherwise
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# HTTP/2 is OPTIONAL (needs the h2 package: pip install "httpx[http2]")
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except Exception:
+    HTTP2 = False
 
 # --- Config / constants ------------------------------------------------------
 
@@ -20,6 +37,9 @@ TRUSTED_DOMAINS = [
     "data.imf.org", "databank.worldbank.org", "tradingeconomics.com",
 ]
 
+# Max Serper requests in flight during the durable sweep (stay under rate limit)
+SWEEP_CONCURRENCY = 5
+
 # Durable sweep seed queries (kept as-is)
 QUERIES = [
     "Tunisia inflation site:ins.tn",
@@ -55,6 +75,17 @@ IRRELEVANT_KEYWORDS = [
     "mexico", "turkey", "romania", "nigeria", "canada", "brazil", "latvia"
 ]
 
+# One compiled union per keyword list: a single pass over the string instead of
+# one substring scan per keyword
+def _union(words: Iterable[str]) -> "re.Pattern[str]":
+    return re.compile("|".join(map(re.escape, words)))
+
+_TRUSTED_SET = frozenset(TRUSTED_DOMAINS)
+_RELEVANT_RE = _union(RELEVANT_KEYWORDS)
+_IRRELEVANT_RE = _union(IRRELEVANT_KEYWORDS)
+_DOC_EXTS = (".pdf", ".xlsx", ".csv", ".json")
+_HINT_RE = re.compile(r"bulletin|press|stat")
+
 # Where we persist links (unchanged)
 JSON_PATH = "serper_links.json"
 EXCEL_PATH = "serper_links.xlsx"
@@ -68,6 +99,17 @@ def _headers() -> Dict[str, str]:
 def _norm_url(u: str) -> str:
     return (u or "").strip()
 
+def _write_json(path: str, obj) -> None:
+    """Indented JSON dump (orjson when available), written atomically."""
+    tmp = path + ".tmp"
+    if orjson is not None:
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
 def _dedupe(seq: Iterable[str]) -> List[str]:
     seen, out = set(), []
     for x in seq:
@@ -76,41 +118,63 @@ def _dedupe(seq: Iterable[str]) -> List[str]:
             seen.add(x); out.append(x)
     return out
 
+@lru_cache(maxsize=4096)
+def _host(u: str) -> str:
+    """Lowercase hostname without a leading 'www.'."""
+    try:
+        host = urlparse(u or "").hostname or ""
+    except ValueError:
+        return ""
+    return host[4:] if host.startswith("www.") else host
+
+def _is_trusted(u: str) -> bool:
+    """Host is a trusted domain or one of its subdomains (one set lookup per label)."""
+    parts = _host(u).split(".")
+    return any(".".join(parts[i:]) in _TRUSTED_SET for i in range(len(parts) - 1))
+
 def domain_trust_score(url: str) -> int:
     """Rough weight by domain trust (used by some scoring flows)."""
-    u = (url or "").lower()
-    for d in TRUSTED_DOMAINS:
-        if d in u:
-            return 2
-    return 0
+    return 2 if _is_trusted(url) else 0
 
 
 # --- Public: Serper search (question-aware) ----------------------------------
 
+def _payload(query: str, num: int, gl: str) -> Dict:
+    return {"q": query, "gl": gl, "num": max(1, min(num, 20)), "type": "search"}
+
+def _parse_organic(data: Dict) -> List[Dict]:
+    out = []
+    for item in data.get("organic", []) or []:
+        link = item.get("link") or item.get("url") or ""
+        if not link:
+            continue
+        out.append({
+            "link": link,
+            "title": item.get("title") or "",
+            "snippet": item.get("snippet") or item.get("description") or "",
+        })
+    return out
+
 def search(query: str, num: int = 10, gl: str = "tn") -> List[Dict]:
     """
     Minimal Serper wrapper returning [{'link','title','snippet'}, ...].
     Safe to import from url_pick.py as serper_search.
     """
-    payload = {"q": query, "gl": gl, "num": max(1, min(num, 20)), "type": "search"}
     try:
-        r = requests.post(SERPER_URL, headers=_headers(), json=payload, timeout=30)
+        r = requests.post(SERPER_URL, headers=_headers(), json=_payload(query, num, gl), timeout=30)
         r.raise_for_status()
-        organic = r.json().get("organic", []) or []
-        out = []
-        for item in organic:
-            link = item.get("link") or item.get("url") or ""
-            if not link:
-                continue
-            out.append({
-                "link": link,
-                "title": item.get("title") or "",
-                "snippet": item.get("snippet") or item.get("description") or "",
-            })
-        return out
+        return _parse_organic(r.json())
     except Exception:
         return []
 
+async def search_async(
+    client: httpx.AsyncClient, query: str, num: int = 10, gl: str = "tn"
+) -> List[Dict]:
+    """Async twin of `search` (raises on HTTP errors so callers can report them)."""
+    r = await client.post(SERPER_URL, headers=_headers(), json=_payload(query, num, gl))
+    r.raise_for_status()
+    return _parse_organic(r.json())
+
 
 def _extract_year_hints(text: str) -> List[str]:
     """
@@ -192,14 +256,15 @@ def search_new_links_for_question(
 
     if not allow_discovery:
         # keep only trusted
-        urls = [u for u in urls if any(d in u.lower() for d in TRUSTED_DOMAINS)]
+        urls = [u for u in urls if _is_trusted(u)]
 
     # light re-rank by trust + doc-type hints
     def _score(u: str) -> int:
-        s = domain_trust_score(u)
-        if any(u.lower().endswith(ext) for ext in (".pdf", ".xlsx", ".csv", ".json")):
+        ul = u.lower()
+        s = domain_trust_score(ul)
+        if ul.endswith(_DOC_EXTS):
             s += 2
-        if "bulletin" in u.lower() or "press" in u.lower() or "stat" in u.lower():
+        if _HINT_RE.search(ul):
             s += 1
         return s
 
@@ -214,13 +279,13 @@ def score_link(link: str) -> int:
     score = 0
     if "tunisia" not in link:
         return 0
-    if any(bad in link for bad in IRRELEVANT_KEYWORDS):
+    if _IRRELEVANT_RE.search(link):
         return 0
-    if any(domain in link for domain in TRUSTED_DOMAINS):
+    if _is_trusted(link):
         score += 2
-    if any(link.endswith(ext) for ext in (".pdf", ".xlsx", ".csv", ".json")):
+    if link.endswith(_DOC_EXTS):
         score += 2
-    if any(kw in link for kw in RELEVANT_KEYWORDS):
+    if _RELEVANT_RE.search(link):
         score += 1
     return score
 
@@ -228,10 +293,11 @@ def load_existing_links() -> list:
     if not os.path.exists(JSON_PATH):
         return []
     try:
-        with open(JSON_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                return [str(u).strip() for u in data if str(u).strip()]
+        with open(JSON_PATH, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if isinstance(data, list):
+            return [str(u).strip() for u in data if str(u).strip()]
     except Exception:
         pass
     return []
@@ -258,12 +324,21 @@ def save_links(urls: List[str]) -> int:
     existing = load_existing_links()
     merged = merge_links(existing, filtered_sorted)
 
-    with open(JSON_PATH, "w", encoding="utf-8") as f:
-        json.dump(merged, f, indent=2, ensure_ascii=False)
+    # Nothing new → both files already hold this list; skip the (slow) rewrite
+    if len(merged) == len(existing) and os.path.exists(EXCEL_PATH):
+        return len(merged)
+
+    _write_json(JSON_PATH, merged)
 
-    df = pd.DataFrame(merged, columns=["URL"])
-    df.index += 1
-    df.to_excel(EXCEL_PATH, index_label="Link No")
+    # Write-only workbook streams rows instead of building a DataFrame/sheet in memory
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append(["Link No", "URL"])
+    for i, u in enumerate(merged, 1):
+        ws.append([i, u])
+    tmp_xlsx = EXCEL_PATH[:-len(".xlsx")] + ".tmp.xlsx"
+    wb.save(tmp_xlsx)
+    os.replace(tmp_xlsx, EXCEL_PATH)
 
     return len(merged)
 
@@ -280,20 +355,26 @@ def fetch_links():
 
     all_links = set()
 
-    for query in QUERIES:
-        print(f"\n📤 Querying: {query!r}")
-        try:
-            results = search(query, num=10)  # uses SERPER_API_KEY / Serper API
-            query_links = [r.get("link", "") for r in results if r.get("link")]
-            print(f"✅ {len(query_links)} links retrieved.")
-            all_links.update(query_links)
-        except Exception as e:
-            print(f"❌ Failed query: {query} → {e}")
-        time.sleep(1.0)
+    # Queries are independent: fan out concurrently (semaphore replaces the sleep throttle)
+    async def _sweep() -> list:
+        sem = asyncio.Semaphore(SWEEP_CONCURRENCY)
+        async with httpx.AsyncClient(http2=HTTP2, timeout=30) as client:
+            async def _one(query: str):
+                async with sem:
+                    print(f"\n📤 Querying: {query!r}")
+                    return await search_async(client, query, num=10)
+            return await asyncio.gather(*[_one(q) for q in QUERIES], return_exceptions=True)
+
+    for query, results in zip(QUERIES, asyncio.run(_sweep())):
+        if isinstance(results, BaseException):
+            print(f"❌ Failed query: {query} → {results}")
+            continue
+        query_links = [r.get("link", "") for r in results if r.get("link")]
+        print(f"✅ {query!r}: {len(query_links)} links retrieved.")
+        all_links.update(query_links)
 
     # Save raw unique links before filtering (optional, helpful for debugging)
-    with open("serper_links_before.json", "w", encoding="utf-8") as f:
-        json.dump(sorted(all_links), f, indent=2)
+    _write_json("serper_links_before.json", sorted(all_links))
     print(f"\n📝 Saved {len(all_links)} unfiltered unique links to serper_links_before.json")
 
     total_after_merge = save_links(sorted(all_links))
@@ -2,21 +2,46 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
+import os
 import re
 import unicodedata
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 # spaCy is OPTIONAL (we fall back gracefully if it's not installed)
 try:
     import spacy
     try:
-        _NLP = spacy.load("en_core_web_sm")
+        # Only noun_chunks (tagger/attribute_ruler POS + parser) and ents (ner) are
+        # used. tok2vec feeds tagger/parser, so it must stay; lemmas are never read.
+        _NLP = spacy.load("en_core_web_sm", disable=["lemmatizer"])
     except Exception:
         _NLP = spacy.blank("en")  # tokenization only
     _NLP.max_length = 4_000_000
 except Exception:
     _NLP = None
 
+# Docs per nlp.pipe() batch in the *_batch helpers
+NLP_BATCH_SIZE = 64
+# Worker processes for large batches. Opt-in (env or n_process=): each nlp.pipe
+# call with n_process > 1 starts a fresh pool that reloads the model, so it only
+# pays off for one big top-level batch past NLP_MULTIPROC_MIN texts.
+NLP_N_PROCESS = int(os.getenv("NLP_N_PROCESS", "1"))
+NLP_MULTIPROC_MIN = 200
+
+# orjson is OPTIONAL (faster taxonomy parse); stdlib json otherwise
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# pyahocorasick is OPTIONAL (one-pass alias scan); precompiled regexes otherwise
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
+
 # Light fallback patterns (only used when taxonomy yields nothing).
 # We DO NOT hard-map to a canonical here. We return the phrase found.
 FALLBACK_KEYWORDS = [
@@ -43,46 +68,103 @@ FALLBACK_KEYWORDS = [
     r"\b(retail\s+sales(\s+index)?)\b",
 ]
 
+# Compiled once at import. The union rules out the common no-hit case in a single
+# scan; the per-pattern objects then give each keyword family its own (possibly
+# overlapping) hit, e.g. both "core inflation" and "inflation".
+_FALLBACK_RES = [re.compile(p, re.I) for p in FALLBACK_KEYWORDS]
+_FALLBACK_ANY = re.compile("|".join(f"(?:{p})" for p in FALLBACK_KEYWORDS), re.I)
+
+_NOUNY_HINT_RE = re.compile(
+    r"(index|rate|balance|inflation|account|reserves|production|supply|exports|imports|gdp|deficit|unemployment|sales)",
+    re.I,
+)
+_CLAUSE_SPLIT_RE = re.compile(r"[.;:\n]\s*")
 
+
+# Latin-1 + Latin Extended-A folded exactly as NFKD→ASCII would (é→e, ç→c, ı dropped, …);
+# NFKD decomposes per character, so the table is equivalent for these code points.
+_ASCII_FOLD = str.maketrans({
+    chr(cp): unicodedata.normalize("NFKD", chr(cp)).encode("ascii", "ignore").decode("ascii")
+    for cp in range(0xA0, 0x180)
+})
+
+
+@lru_cache(maxsize=4096)
 def normalize(text: str) -> str:
-    return unicodedata.normalize("NFKD", (text or "")).encode("ascii", "ignore").decode("utf-8").lower().strip()
+    s = text or ""
+    if not s.isascii():
+        s = s.translate(_ASCII_FOLD)
+        if not s.isascii():
+            s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
+    return s.lower().strip()
+
+
+def _phrases_from_doc(doc) -> List[str]:
+    phrases = set()
+    if hasattr(doc, "noun_chunks"):
+        for chunk in doc.noun_chunks:
+            s = chunk.text.strip()
+            if 3 <= len(s) <= 80:
+                phrases.add(s)
+    for ent in getattr(doc, "ents", []):
+        s = ent.text.strip()
+        if 3 <= len(s) <= 80:
+            phrases.add(s)
+    return list(phrases)
 
 
 def _iter_nouny_phrases(text: str) -> List[str]:
     """Return noun-like candidate phrases (spaCy if available; else a light fallback)."""
     if _NLP is not None:
-        doc = _NLP(text)
-        phrases = set()
-        if hasattr(doc, "noun_chunks"):
-            for chunk in doc.noun_chunks:
-                s = chunk.text.strip()
-                if 3 <= len(s) <= 80:
-                    phrases.add(s)
-        for ent in getattr(doc, "ents", []):
-            s = ent.text.strip()
-            if 3 <= len(s) <= 80:
-                phrases.add(s)
-        return list(phrases)
+        return _phrases_from_doc(_NLP(text))
 
     # Very light fallback: split and keep spans likely referencing indicators
     out: List[str] = []
-    for part in re.split(r"[.;:\n]\s*", text):
-        if re.search(r"(index|rate|balance|inflation|account|reserves|production|supply|exports|imports|gdp|deficit|unemployment|sales)", part, flags=re.I):
+    for part in _CLAUSE_SPLIT_RE.split(text):
+        if _NOUNY_HINT_RE.search(part):
             part = part.strip()
             if 3 <= len(part) <= 160:
                 out.append(part)
     return out
 
 
+def batch_iter_nouny_phrases(texts: List[str], n_process: Optional[int] = None) -> List[List[str]]:
+    """
+    Same as _iter_nouny_phrases, but streams all texts through spaCy in batches,
+    across n_process workers (default NLP_N_PROCESS) for large inputs.
+    """
+    if _NLP is not None:
+        if n_process is None:
+            n_process = NLP_N_PROCESS if len(texts) > NLP_MULTIPROC_MIN else 1
+        if n_process > 1 and multiprocessing.parent_process() is not None:
+            n_process = 1  # already inside a pool worker: never nest process pools
+        docs = _NLP.pipe(texts, batch_size=NLP_BATCH_SIZE, n_process=n_process)
+        return [_phrases_from_doc(doc) for doc in docs]
+    return [_iter_nouny_phrases(t) for t in texts]
+
+
 def load_indicators(json_path: str = "economic_indicator.json") -> List[Dict[str, Any]]:
     """
     Load taxonomy entries. Accepts either:
       - [{"Canonical Name": "...", "Aliases": [...]}]
       - {"indicators": [ {...}, ... ]}
     Returns a flat list of dicts with "Canonical Name" and "Aliases".
+    Parsed once per file version (path, mtime); the returned list is shared,
+    so copy it before mutating.
     """
     try:
-        data = json.load(open(json_path, "r", encoding="utf-8"))
+        mtime = os.path.getmtime(json_path)
+    except OSError:
+        return []
+    return _load_indicators_at(json_path, mtime)
+
+
+@lru_cache(maxsize=8)
+def _load_indicators_at(json_path: str, mtime: float) -> List[Dict[str, Any]]:
+    try:
+        with open(json_path, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception:
         return []
 
@@ -101,12 +183,94 @@ def load_indicators(json_path: str = "economic_indicator.json") -> List[Dict[str
         aliases = [a for a in aliases if isinstance(a, str) and a.strip()]
         if canonical or aliases:
             norm.append({"Canonical Name": canonical, "Aliases": aliases})
+    _compile_aliases(norm)  # precompute patterns once per file version
     return norm
 
 
-def _find_original_span(text: str, pattern: str) -> Optional[str]:
-    m = re.search(pattern, text, flags=re.I)
-    return m.group(0) if m else None
+# Compiled alias patterns (+ automaton) for the last indicators list seen. Keyed
+# on the list object itself (a strong ref, so its id can't be recycled) plus its length.
+_ALIAS_CACHE: Optional[Tuple[List[Dict[str, Any]], int, Tuple[list, Any, frozenset, Optional[list]]]] = None
+
+
+def _is_word(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def _bounded(text: str, start: int, end: int) -> bool:
+    """Same test as r"\b<phrase>\b" for the occurrence text[start:end]."""
+    before = start > 0 and _is_word(text[start - 1])
+    after = end < len(text) and _is_word(text[end])
+    return before != _is_word(text[start]) and after != _is_word(text[end - 1])
+
+
+@lru_cache(maxsize=8192)
+def _compile_entry(canonical: str, aliases: Tuple[str, ...]) -> Tuple[tuple, ...]:
+    """
+    Normalized + compiled patterns for one taxonomy entry, memoized on its
+    contents: a rebuilt or extended taxonomy only pays for the entries that changed.
+    """
+    phrases = [(canonical, 90)] if canonical else []
+    phrases += [(a, 80) for a in aliases]
+    out = []
+    for phrase, confidence in phrases:
+        p_norm = normalize(phrase)
+        if not p_norm and confidence == 80:
+            continue  # empty aliases are skipped (canonicals are kept as before)
+        out.append((
+            re.compile(r"\b" + re.escape(p_norm) + r"\b"),
+            re.compile(r"\b" + re.escape(phrase) + r"\b", re.I),
+            phrase,
+            confidence,
+            p_norm,
+        ))
+    return tuple(out)
+
+
+def _trigrams(s: str) -> set:
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+
+def _compile_aliases(indicators: List[Dict[str, Any]]) -> Tuple[list, Any, frozenset, Optional[list]]:
+    """
+    Flatten taxonomy entries into (norm_re, orig_re, label, confidence), in
+    canonical-then-aliases order. norm_re runs on normalize(text); orig_re
+    recovers the phrase as written in the original text.
+    Also returns an Aho-Corasick automaton over the normalized phrases (None
+    without pyahocorasick) and the indices whose phrase normalizes to "".
+    Without the automaton, each phrase's trigram set is kept instead so the
+    regex scan can skip phrases that cannot occur in the text.
+    """
+    global _ALIAS_CACHE
+    if _ALIAS_CACHE is not None and _ALIAS_CACHE[0] is indicators and _ALIAS_CACHE[1] == len(indicators):
+        return _ALIAS_CACHE[2]
+
+    compiled: List[Tuple[re.Pattern, re.Pattern, str, int]] = []
+    norms: List[str] = []
+    for entry in indicators:
+        canonical = (entry.get("Canonical Name") or "").strip()
+        for norm_re, orig_re, phrase, confidence, p_norm in _compile_entry(
+            canonical, tuple(entry.get("Aliases") or ())
+        ):
+            compiled.append((norm_re, orig_re, phrase, confidence))
+            norms.append(p_norm)
+
+    automaton = None
+    if ahocorasick is not None:
+        by_norm: Dict[str, List[int]] = {}
+        for i, p_norm in enumerate(norms):
+            if p_norm:
+                by_norm.setdefault(p_norm, []).append(i)
+        if by_norm:
+            automaton = ahocorasick.Automaton()
+            for p_norm, idxs in by_norm.items():
+                automaton.add_word(p_norm, (len(p_norm), tuple(idxs)))
+            automaton.make_automaton()
+    empties = frozenset(i for i, p_norm in enumerate(norms) if not p_norm)
+
+    grams = [frozenset(_trigrams(p_norm)) for p_norm in norms] if automaton is None else None
+
+    _ALIAS_CACHE = (indicators, len(indicators), (compiled, automaton, empties, grams))
+    return _ALIAS_CACHE[2]
 
 
 def regex_match_aliases(text: str, indicators: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -116,37 +280,36 @@ def regex_match_aliases(text: str, indicators: List[Dict[str, Any]]) -> List[Dic
     Downstream (extractor) will map it or auto-add a canonical+alias as needed.
     """
     out: List[Dict[str, Any]] = []
+    if not indicators:
+        return out
     text_norm = normalize(text)
 
-    for entry in indicators or []:
-        canonical = (entry.get("Canonical Name") or "").strip()
-        aliases = entry.get("Aliases") or []
-
-        if canonical:
-            c_norm = normalize(canonical)
-            if re.search(r"\b" + re.escape(c_norm) + r"\b", text_norm):
-                orig = _find_original_span(text, r"\b" + re.escape(canonical) + r"\b") or canonical
-                out.append({
-                    "Indicator": orig,
-                    "RawText": orig,
-                    "Matched": True,
-                    "Confidence": 90,
-                    "Method": "Regex",
-                })
-
-        for alias in aliases:
-            a_norm = normalize(alias)
-            if not a_norm:
-                continue
-            if re.search(r"\b" + re.escape(a_norm) + r"\b", text_norm):
-                orig = _find_original_span(text, r"\b" + re.escape(alias) + r"\b") or alias
-                out.append({
-                    "Indicator": orig,
-                    "RawText": orig,
-                    "Matched": True,
-                    "Confidence": 80,
-                    "Method": "Regex",
-                })
+    compiled, automaton, empties, grams = _compile_aliases(indicators)
+    if automaton is not None:
+        # One pass over the text for all phrases; keep whole-word hits only
+        hits = set(empties)
+        for end, (length, idxs) in automaton.iter(text_norm):
+            if _bounded(text_norm, end - length + 1, end + 1):
+                hits.update(idxs)
+        candidates = sorted(hits)
+    else:
+        # Trigram prefilter: a whole-word hit needs every trigram of the phrase
+        text_grams = _trigrams(text_norm)
+        candidates = [i for i, g in enumerate(grams) if g <= text_grams]
+
+    for i in candidates:
+        norm_re, orig_re, label, confidence = compiled[i]
+        if (automaton is None or i in empties) and not norm_re.search(text_norm):
+            continue
+        m = orig_re.search(text)
+        orig = m.group(0) if m else label
+        out.append({
+            "Indicator": orig,
+            "RawText": orig,
+            "Matched": True,
+            "Confidence": confidence,
+            "Method": "Regex",
+        })
 
     # dedupe by Indicator text
     seen = set()
@@ -159,21 +322,18 @@ def regex_match_aliases(text: str, indicators: List[Dict[str, Any]]) -> List[Dic
     return deduped
 
 
-def nlp_match_indicators(text: str) -> List[Dict[str, Any]]:
-    """
-    Very mild heuristic when taxonomy finds nothing.
-    Returns phrases like "retail sales index", "policy rate", etc.
-    """
+def _heuristic_matches(text: str, spans: List[str]) -> List[Dict[str, Any]]:
+    """Keyword + nouny-phrase heuristic over precomputed candidate spans."""
     matches: List[Dict[str, Any]] = []
     s_norm = normalize(text)
 
     # keyword hits
-    for pat in FALLBACK_KEYWORDS:
-        m = re.search(pat, s_norm, flags=re.I)
+    for rx in (_FALLBACK_RES if _FALLBACK_ANY.search(s_norm) else ()):
+        m = rx.search(s_norm)
         if m:
             phrase = m.group(0)
             if _NLP is not None:
-                for span in _iter_nouny_phrases(text):
+                for span in spans:
                     if phrase.lower() in span.lower():
                         phrase = span.strip()
                         break
@@ -187,8 +347,8 @@ def nlp_match_indicators(text: str) -> List[Dict[str, Any]]:
                 })
 
     # extra nouny phrases (very conservative)
-    for span in _iter_nouny_phrases(text):
-        if re.search(r"(index|rate|balance|inflation|account|reserves|production|supply|exports|imports|gdp|deficit|unemployment|sales)", span, flags=re.I):
+    for span in spans:
+        if _NOUNY_HINT_RE.search(span):
             s = span.strip()
             matches.append({
                 "Indicator": s,
@@ -209,6 +369,20 @@ def nlp_match_indicators(text: str) -> List[Dict[str, Any]]:
     return deduped
 
 
+def nlp_match_indicators(text: str) -> List[Dict[str, Any]]:
+    """
+    Very mild heuristic when taxonomy finds nothing.
+    Returns phrases like "retail sales index", "policy rate", etc.
+    """
+    return _heuristic_matches(text, _iter_nouny_phrases(text))
+
+
+def nlp_match_indicators_batch(texts: List[str], n_process: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+    """nlp_match_indicators for many texts, parsing them with one nlp.pipe pass."""
+    spans_all = batch_iter_nouny_phrases(texts, n_process=n_process)
+    return [_heuristic_matches(t, spans) for t, spans in zip(texts, spans_all)]
+
+
 def has_conflicting_term(indicator_phrase: str, sentence: str) -> bool:
     """
     Minimal guard to avoid classic confusions (e.g., GDP vs current account).
@@ -237,9 +411,38 @@ def match_indicators(text: str, indicators: List[Dict[str, Any]]) -> List[Dict[s
     return cleaned
 
 
+def match_indicators_batch(
+    texts: List[str],
+    indicators: List[Dict[str, Any]],
+    nlp_matches: Optional[List[List[Dict[str, Any]]]] = None,
+) -> List[List[Dict[str, Any]]]:
+    """
+    match_indicators over many texts. Texts without a taxonomy hit go through
+    spaCy together; pass `nlp_matches` to reuse an existing batch of NLP results.
+    """
+    exact = [regex_match_aliases(t, indicators) for t in texts]
+    if nlp_matches is None:
+        todo = [i for i, e in enumerate(exact) if not e]
+        nlp_matches = [[] for _ in texts]
+        for i, res in zip(todo, nlp_match_indicators_batch([texts[i] for i in todo])):
+            nlp_matches[i] = res
+
+    out: List[List[Dict[str, Any]]] = []
+    for text, e, n in zip(texts, exact, nlp_matches):
+        out.append([m for m in (e if e else n) if not has_conflicting_term(m["Indicator"], text)])
+    return out
+
+
+_YEAR_RE = re.compile(r"\b(19[7-9]\d|20[0-3]\d|203[0-5])\b")
+_VALUE_RE = re.compile(
+    r"(\d{1,3}(?:[\s.,]\d{3})+|\d+(?:[.,]\d+)?)(\s?(%|percent|tnd|usd|eur|dinar[s]?|euros?|dollars?|million[s]?|billion[s]?|thousand[s]?|milliers|milliard[s]?))?"
+)
+_VALUE_CONTEXT_RE = re.compile(r"\b(as of|since|in|year|from|to|during|forecast|projected|between|by)\b")
+
+
 def extract_year(text: str) -> Optional[int]:
     """Return a plausible year (1970..2035)."""
-    m = re.search(r"\b(19[7-9]\d|20[0-3]\d|203[0-5])\b", text)
+    m = _YEAR_RE.search(text)
     return int(m.group()) if m else None
 
 
@@ -250,8 +453,7 @@ def extract_value(text: str) -> Tuple[Optional[float], Optional[str]]:
     Filters out years masquerading as values unless context indicates otherwise.
     """
     t = (text or "").lower().replace("\u202f", " ").replace("\xa0", " ")
-    pattern = r"(\d{1,3}(?:[\s.,]\d{3})+|\d+(?:[.,]\d+)?)(\s?(%|percent|tnd|usd|eur|dinar[s]?|euros?|dollars?|million[s]?|billion[s]?|thousand[s]?|milliers|milliard[s]?))?"
-    m = re.search(pattern, t)
+    m = _VALUE_RE.search(t)
     if not m:
         return None, None
 
@@ -265,7 +467,7 @@ def extract_value(text: str) -> Tuple[Optional[float], Optional[str]]:
         return None, None
 
     # looks like a year?
-    if 1900 <= val <= 2099 and unit is None and not re.search(r"\b(as of|since|in|year|from|to|during|forecast|projected|between|by)\b", t):
+    if 1900 <= val <= 2099 and unit is None and not _VALUE_CONTEXT_RE.search(t):
         return None, None
 
     if unit:
@@ -2,6 +2,13 @@
 import os, json
 from langchain_community.vectorstores import FAISS
 from langchain_huggingface import HuggingFaceEmbeddings
+from upsert_embeddings import build_hnsw_index  # run from vectorization/, like the paths below
+
+# orjson is OPTIONAL (faster parse of the multi-MB input); stdlib json otherwise
+try:
+    import orjson
+except Exception:
+    orjson = None
 
 
 INPUT_JSON = "../scraping/output/improved_structured_indicators.json"
@@ -9,44 +16,51 @@ FAISS_DIR = "faiss_index"
 EMBED_MODEL = "BAAI/bge-base-en-v1.5"
 
 # 1) Load
-with open(INPUT_JSON, "r", encoding="utf-8") as f:
-    entries = json.load(f)
-
-texts, metadatas = [], []
+with open(INPUT_JSON, "rb") as f:
+    raw = f.read()
+entries = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 def to_text(e):
-    year = e.get("Year")
-    ind  = (e.get("CanonicalIndicator") or e.get("Indicator") or "").strip()
-    val  = e.get("DisplayValue") or e.get("Value")
-    unit = e.get("Unit") or ""
-    src  = e.get("Source") or "unknown"
-    raw  = (e.get("RawText") or "")[:800]
+    g = e.get
+    year = g("Year")
+    ind  = (g("CanonicalIndicator") or g("Indicator") or "").strip()
+    val  = g("DisplayValue") or g("Value")
+    unit = g("Unit") or ""
+    src  = g("Source") or "unknown"
+    raw  = (g("RawText") or "")[:800]
     # BGE likes passage prefix
     return f"passage: Tunisia | {ind} | year={year} | value={val} {unit} | source={src}. Context: {raw}"
 
-for i, e in enumerate(entries):
-    texts.append(to_text(e))
+def to_meta(i, e):
     # keep rich meta for UI / later use
-    metadatas.append({
+    g = e.get
+    return {
         "id": i,
-        "year": e.get("Year"),
-        "indicator": e.get("CanonicalIndicator") or e.get("Indicator"),
-        "value": e.get("DisplayValue") or e.get("Value"),
-        "unit": e.get("Unit"),
-        "source": e.get("Source"),
-        "category": e.get("Category"),
-        "confidence": e.get("Confidence"),
-    })
+        "year": g("Year"),
+        "indicator": g("CanonicalIndicator") or g("Indicator"),
+        "value": g("DisplayValue") or g("Value"),
+        "unit": g("Unit"),
+        "source": g("Source"),
+        "category": g("Category"),
+        "confidence": g("Confidence"),
+    }
+
+texts = [to_text(e) for e in entries]
+metadatas = [to_meta(i, e) for i, e in enumerate(entries)]
 
 # 2) Embed model (normalize=True for cosine via IP)
 embedding_model = HuggingFaceEmbeddings(
     model_name=EMBED_MODEL,
-    model_kwargs={"device": "cuda"}, 
-    encode_kwargs={"normalize_embeddings": True}
+    # fp16 on GPU halves the bytes moved per batch; negligible loss for retrieval
+    model_kwargs={"device": "cuda", "model_kwargs": {"torch_dtype": "float16"}},
+    encode_kwargs={"batch_size": 128, "normalize_embeddings": True}
 )
 
 # 3) Build & save
 os.makedirs(FAISS_DIR, exist_ok=True)
 vectorstore = FAISS.from_texts(texts, embedding_model, metadatas=metadatas)
+
+# Persist an HNSW graph (sub-linear queries) instead of the flat index; same vectors/docstore
+vectorstore.index = build_hnsw_index(vectorstore.index)
 vectorstore.save_local(FAISS_DIR)
 print(f"✅ Saved {len(texts)} docs to {FAISS_DIR} with {EMBED_MODEL}")
@@ -1,14 +1,27 @@
 # vectorization/query_vectorstore.py — alias-aware + growth vs level disambiguation
 import re, json, pathlib
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from langchain_community.vectorstores import FAISS
 from langchain_huggingface import HuggingFaceEmbeddings
+import faiss
+
+# pyahocorasick is OPTIONAL (one-pass alias scan); plain substring loop otherwise
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
 
 FAISS_DIR = "faiss_index"
 EMBED_MODEL = "BAAI/bge-base-en-v1.5"
 
+# Query-time breadth of the HNSW graph search (indexes are built as HNSW by
+# generate_embeddings / upsert_embeddings.build_hnsw_index)
+HNSW_EF_SEARCH = 64
+
 # ---------- Load indicator aliases ----------
 def _load_indicator_aliases() -> Dict[str, list]:
+    """Alias map for the first taxonomy file found; rebuilt only when it changes."""
     candidates = [
         pathlib.Path("scraping/economic_indicators.json"),
         pathlib.Path("scraping/economic_indicator.json"),
@@ -16,7 +29,11 @@ def _load_indicator_aliases() -> Dict[str, list]:
         pathlib.Path("economic_indicator.json"),
     ]
     path = next((p for p in candidates if p.exists()), None)
+    mtime = path.stat().st_mtime if path else None
+    return _build_indicator_aliases(str(path) if path else None, mtime)
 
+@lru_cache(maxsize=4)
+def _build_indicator_aliases(path: Optional[str], mtime: Optional[float]) -> Dict[str, list]:
     aliases_map: Dict[str, list] = {}
     if path:
         with open(path, "r", encoding="utf-8") as f:
@@ -55,6 +72,22 @@ def _load_indicator_aliases() -> Dict[str, list]:
 
 INDICATOR_ALIASES = _load_indicator_aliases()
 
+def _build_alias_automaton(aliases_map: Dict[str, list]):
+    """alias → (rank, canon), keeping the earliest canonical when an alias is shared."""
+    if ahocorasick is None:
+        return None
+    ac = ahocorasick.Automaton()
+    for rank, (canon, aliases) in enumerate(aliases_map.items()):
+        for a in aliases:
+            if a and a not in ac:
+                ac.add_word(a, (rank, canon))
+    if len(ac) == 0:
+        return None
+    ac.make_automaton()
+    return ac
+
+_ALIAS_AC = _build_alias_automaton(INDICATOR_ALIASES)
+
 # ---------- Embedder + Vector store ----------
 embedder = HuggingFaceEmbeddings(
     model_name=EMBED_MODEL,
@@ -62,6 +95,9 @@ embedder = HuggingFaceEmbeddings(
 )
 vs = FAISS.load_local(FAISS_DIR, embedder, allow_dangerous_deserialization=True)
 
+if isinstance(vs.index, faiss.IndexHNSW):
+    vs.index.hnsw.efSearch = HNSW_EF_SEARCH
+
 # ---------- Parsers ----------
 YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")  # years 1900-2099
 
@@ -69,20 +105,27 @@ def detect_year(q: str) -> Optional[int]:
     m = YEAR_RE.search(q)
     return int(m.group(0)) if m else None
 
+GROWTH_RE = re.compile("|".join(map(re.escape, [
+    "growth", "croissance", "annual %", "annual percent", "yoy", "year-on-year"
+])))
+RATE_RE = re.compile("|".join(map(re.escape, ["rate", "taux", "%"])))
+
 def detect_indicator(q: str) -> Optional[str]:
     ql = q.lower()
+    if _ALIAS_AC is not None:
+        # Single scan; the earliest canonical (taxonomy order) wins, as in the loop below
+        best = min((hit for _, hit in _ALIAS_AC.iter(ql)), default=None)
+        return best[1] if best else None
     for canon, aliases in INDICATOR_ALIASES.items():
         if any(a in ql for a in aliases):
             return canon
     return None
 
 def wants_growth(q: str) -> bool:
-    ql = q.lower()
-    return any(w in ql for w in ["growth", "croissance", "annual %", "annual percent", "yoy", "year-on-year"])
+    return GROWTH_RE.search(q.lower()) is not None
 
 def wants_rate(q: str) -> bool:
-    ql = q.lower()
-    return any(w in ql for w in ["rate", "taux", "%"])
+    return RATE_RE.search(q.lower()) is not None
 
 # ---------- Query ----------
 def ask(q: str, k: int = 5) -> List[Dict[str, Any]]:
@@ -4,11 +4,20 @@ from __future__ import annotations
 import os
 import json
 import hashlib
+import pickle
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Any, Optional
 
+import faiss
 from langchain_community.vectorstores import FAISS
 
+# orjson is OPTIONAL (faster load/save of multi-MB JSON); stdlib json otherwise
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 try:
     # Preferred new package (avoids deprecation)
     from langchain_huggingface import HuggingFaceEmbeddings
@@ -25,41 +34,58 @@ PROJECT_ROOT = THIS_DIR.parent
 
 IMPROVED_JSON = PROJECT_ROOT / "scraping" / "output" / "improved_structured_indicators.json"
 FAISS_DIR = Path(os.getenv("FAISS_DIR", str(PROJECT_ROOT / "vectorization" / "faiss_index")))
-STATE_PATH = FAISS_DIR / "upsert_state.json"
+STATE_PATH = FAISS_DIR / "upsert_state.pkl"
+LEGACY_STATE_PATH = FAISS_DIR / "upsert_state.json"  # read once, then superseded
 
 EMBED_MODEL = os.getenv("EMBED_MODEL", "BAAI/bge-base-en-v1.5")
 EMBED_DEVICE = os.getenv("EMBED_DEVICE", "cpu")  # "cuda" if available
+EMBED_DTYPE = os.getenv("EMBED_DTYPE", "float16")  # GPU only; "bfloat16" on Ampere+
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "256"))
+ADD_CHUNK = 4096  # rows per add_texts call (bounds peak embedding memory)
+
+# Saved indexes are HNSW graphs (sub-linear queries), whichever script built them
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
 
 
 # ───────────────────────────────────────────────────────────────────────────────
 # IO helpers
 # ───────────────────────────────────────────────────────────────────────────────
 
+def _parse_json(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
 def _load_json(path: Path) -> List[dict]:
     if not path.exists():
         return []
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _parse_json(path.read_bytes())
         return data if isinstance(data, list) else []
     except Exception:
         return []
 
 
 def _load_state(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        return {"seen": []}
+    """State dict with `seen` as a set (pickled); falls back to the legacy JSON list."""
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        if path.exists():
+            state = pickle.loads(path.read_bytes())
+        elif LEGACY_STATE_PATH.exists():
+            state = _parse_json(LEGACY_STATE_PATH.read_bytes())
+        else:
+            return {"seen": set()}
+        state["seen"] = set(state.get("seen", ()))
+        return state
     except Exception:
-        return {"seen": []}
+        return {"seen": set()}
 
 
 def _save_state(path: Path, state: Dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(tmp, path)
 
 
 # ───────────────────────────────────────────────────────────────────────────────
@@ -79,15 +105,31 @@ def _pick_source_and_url(row: Dict[str, Any]) -> Tuple[str, Optional[str]]:
 def _stable_key(row: Dict[str, Any]) -> str:
     """
     Create a robust key so we don't re-upsert duplicates.
-    Use CanonicalIndicator/Indicator + DateISO/Year + Value + Unit + SourceURL/Source
+    Use CanonicalIndicator/Indicator + DateISO/Year + Value + Unit + SourceURL/Source.
+    The joined payload itself is the key: set membership needs no digest.
     """
     indicator = (row.get("CanonicalIndicator") or row.get("Indicator") or "").strip().lower()
     date = (row.get("DateISO") or row.get("Year") or "").__str__().strip().lower()
     value = (row.get("Value")).__str__() if row.get("Value") is not None else ""
     unit = (row.get("Unit") or "").strip().lower()
     src_url = (row.get("SourceURL") or row.get("URL") or row.get("Source") or "").strip().lower()
-    payload = f"{indicator}|{date}|{value}|{unit}|{src_url}"
-    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    return f"{indicator}|{date}|{value}|{unit}|{src_url}"
+
+
+def _seen_keys(state: Dict[str, Any], rows: List[dict]) -> set:
+    """
+    Seen-set from the state file. Older states stored sha1(payload) digests;
+    those are translated once by re-hashing the current rows' payloads.
+    """
+    seen = state["seen"]
+    if state.get("key") == "payload" or not seen:
+        return seen
+    migrated = set()
+    for r in rows:
+        key = _stable_key(r)
+        if hashlib.sha1(key.encode("utf-8")).hexdigest() in seen:
+            migrated.add(key)
+    return migrated
 
 
 def _row_to_text_meta(row: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
@@ -135,13 +177,35 @@ def _row_to_text_meta(row: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
     return text, metadata
 
 
-def _load_or_create_faiss(embeddings: HuggingFaceEmbeddings) -> FAISS:
+@lru_cache(maxsize=1)
+def _get_embedder() -> HuggingFaceEmbeddings:
+    """Load the embedding model once per process; periodic upserts reuse it."""
+    model_kwargs: Dict[str, Any] = {"device": EMBED_DEVICE}
+    if EMBED_DEVICE.startswith("cuda"):
+        # Half-precision weights/activations: embedding is bandwidth-bound on GPU
+        model_kwargs["model_kwargs"] = {"torch_dtype": EMBED_DTYPE}
+    return HuggingFaceEmbeddings(
+        model_name=EMBED_MODEL,
+        model_kwargs=model_kwargs,
+        encode_kwargs={"batch_size": EMBED_BATCH_SIZE, "normalize_embeddings": True},
+    )
+
+
+def build_hnsw_index(index: "faiss.Index") -> "faiss.IndexHNSWFlat":
+    """HNSW copy of a (flat) FAISS index: same vectors, same metric, same row order."""
+    hnsw = faiss.IndexHNSWFlat(index.d, HNSW_M, index.metric_type)
+    hnsw.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+    if index.ntotal:
+        hnsw.add(index.reconstruct_n(0, index.ntotal))
+    return hnsw
+
+
+def _load_faiss(embeddings: HuggingFaceEmbeddings) -> Optional[FAISS]:
     idx_file = FAISS_DIR / "index.faiss"
     pkl_file = FAISS_DIR / "index.pkl"
     if idx_file.exists() and pkl_file.exists():
         return FAISS.load_local(str(FAISS_DIR), embeddings=embeddings, allow_dangerous_deserialization=True)
-    FAISS_DIR.mkdir(parents=True, exist_ok=True)
-    return FAISS.from_texts(texts=[], embedding=embeddings, metadatas=[])
+    return None
 
 
 # ───────────────────────────────────────────────────────────────────────────────
@@ -160,7 +224,11 @@ def upsert_latest(max_new: int | None = None) -> int:
         return 0
 
     state = _load_state(STATE_PATH)
-    seen = set(state.get("seen", []))
+    seen = _seen_keys(state, rows)
+    if state.get("key") != "payload":
+        state["key"] = "payload"
+        state["seen"] = seen
+        _save_state(STATE_PATH, state)
 
     # Prepare new pairs
     new_pairs: List[Tuple[str, Dict[str, Any]]] = []
@@ -189,17 +257,25 @@ def upsert_latest(max_new: int | None = None) -> int:
         new_pairs = new_pairs[:max_new]
         newly_seen = newly_seen[:max_new]
 
-    embeddings = HuggingFaceEmbeddings(
-        model_name=EMBED_MODEL,
-        model_kwargs={"device": EMBED_DEVICE},
-        encode_kwargs={"normalize_embeddings": True},
-    )
-
-    vs = _load_or_create_faiss(embeddings)
-    vs.add_texts(texts=[t for t, _ in new_pairs], metadatas=[m for _, m in new_pairs])
+    embeddings = _get_embedder()
+    vs = _load_faiss(embeddings)
+    texts = [t for t, _ in new_pairs]
+    metas = [m for _, m in new_pairs]
+    for i in range(0, len(texts), ADD_CHUNK):
+        chunk_t, chunk_m = texts[i:i + ADD_CHUNK], metas[i:i + ADD_CHUNK]
+        if vs is None:
+            # No index on disk yet: the first chunk seeds it (as HNSW, like generate_embeddings)
+            vs = FAISS.from_texts(chunk_t, embeddings, metadatas=chunk_m)
+            vs.index = build_hnsw_index(vs.index)
+        else:
+            vs.add_texts(texts=chunk_t, metadatas=chunk_m)
+    if not isinstance(vs.index, faiss.IndexHNSW):
+        vs.index = build_hnsw_index(vs.index)  # older flat index on disk
+    FAISS_DIR.mkdir(parents=True, exist_ok=True)
     vs.save_local(str(FAISS_DIR))
 
-    state["seen"] = list(seen.union(newly_seen))
+    seen.update(newly_seen)
+    state["seen"] = seen
     _save_state(STATE_PATH, state)
 
     return len(new_pairs)